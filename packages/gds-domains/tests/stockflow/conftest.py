@@ -0,0 +1,249 @@
+"""Shared fixtures for stockflow tests.
+
+Models and their compiled artifacts are read-only in every test that uses
+them, so they are built once per session.
+"""
+
+import pytest
+
+from gds.canonical import CanonicalGDS, project_canonical
+from gds.ir.models import SystemIR
+from gds.spec import GDSSpec
+from gds_domains.stockflow.dsl.compile import compile_model, compile_to_system
+from gds_domains.stockflow.dsl.elements import Auxiliary, Converter, Flow, Stock
+from gds_domains.stockflow.dsl.model import StockFlowModel
+
+
+@pytest.fixture(scope="session")
+def population_model() -> StockFlowModel:
+    return StockFlowModel(
+        name="Population",
+        stocks=[Stock(name="Population", initial=1000.0)],
+        flows=[
+            Flow(name="Births", target="Population"),
+            Flow(name="Deaths", source="Population"),
+        ],
+        auxiliaries=[
+            Auxiliary(name="Birth Rate", inputs=["Population", "Fertility"]),
+            Auxiliary(name="Death Rate", inputs=["Population"]),
+        ],
+        converters=[Converter(name="Fertility")],
+    )
+
+
+@pytest.fixture(scope="session")
+def two_stock_model() -> StockFlowModel:
+    return StockFlowModel(
+        name="Predator Prey",
+        stocks=[
+            Stock(name="Prey", initial=100.0),
+            Stock(name="Predator", initial=20.0),
+        ],
+        flows=[
+            Flow(name="Prey Births", target="Prey"),
+            Flow(name="Prey Deaths", source="Prey"),
+            Flow(name="Predator Births", target="Predator"),
+            Flow(name="Predator Deaths", source="Predator"),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def predator_prey_model() -> StockFlowModel:
+    """Two stocks coupled through four auxiliaries (cross-domain, integration)."""
+    return StockFlowModel(
+        name="Predator Prey",
+        stocks=[
+            Stock(name="Prey", initial=100.0),
+            Stock(name="Predator", initial=20.0),
+        ],
+        flows=[
+            Flow(name="Prey Births", target="Prey"),
+            Flow(name="Prey Deaths", source="Prey"),
+            Flow(name="Predator Births", target="Predator"),
+            Flow(name="Predator Deaths", source="Predator"),
+        ],
+        auxiliaries=[
+            Auxiliary(name="Prey Growth", inputs=["Prey"]),
+            Auxiliary(name="Predation", inputs=["Prey", "Predator"]),
+            Auxiliary(name="Predator Growth", inputs=["Predator", "Prey"]),
+            Auxiliary(name="Predator Decline", inputs=["Predator"]),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def population_dynamics_model() -> StockFlowModel:
+    """Population model with a description (integration)."""
+    return StockFlowModel(
+        name="Population Dynamics",
+        stocks=[Stock(name="Population", initial=1000.0)],
+        flows=[
+            Flow(name="Births", target="Population"),
+            Flow(name="Deaths", source="Population"),
+        ],
+        auxiliaries=[
+            Auxiliary(name="Birth Rate", inputs=["Population", "Fertility"]),
+            Auxiliary(name="Death Rate", inputs=["Population"]),
+        ],
+        converters=[Converter(name="Fertility")],
+        description="Simple population dynamics model",
+    )
+
+
+@pytest.fixture(scope="session")
+def sir_model() -> StockFlowModel:
+    """Classic SIR epidemiology model (integration)."""
+    return StockFlowModel(
+        name="SIR",
+        stocks=[
+            Stock(name="Susceptible", initial=999.0),
+            Stock(name="Infected", initial=1.0),
+            Stock(name="Recovered", initial=0.0),
+        ],
+        flows=[
+            Flow(name="Infection", source="Susceptible", target="Infected"),
+            Flow(name="Recovery", source="Infected", target="Recovered"),
+        ],
+        auxiliaries=[
+            Auxiliary(
+                name="Infection Rate",
+                inputs=["Susceptible", "Infected", "Contact Rate"],
+            ),
+            Auxiliary(name="Recovery Rate", inputs=["Infected", "Recovery Time"]),
+        ],
+        converters=[
+            Converter(name="Contact Rate"),
+            Converter(name="Recovery Time"),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def branching_model() -> StockFlowModel:
+    """Two stocks, branching auxiliaries, one converter (over-collapsing)."""
+    return StockFlowModel(
+        name="Branching",
+        stocks=[
+            Stock(name="Hot", initial=80.0),
+            Stock(name="Cold", initial=20.0),
+        ],
+        flows=[
+            Flow(name="Heat Loss", source="Hot"),
+            Flow(name="Heat Gain", target="Cold"),
+            Flow(name="Exchange", source="Hot", target="Cold"),
+        ],
+        auxiliaries=[
+            # Branch A: reads Hot only
+            Auxiliary(name="Radiation", inputs=["Hot"]),
+            # Branch B: reads Cold only
+            Auxiliary(name="Absorption", inputs=["Cold", "Ambient"]),
+            # Cross-branch: reads both
+            Auxiliary(name="Gradient", inputs=["Hot", "Cold"]),
+        ],
+        converters=[
+            Converter(name="Ambient"),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def ecosystem_model() -> StockFlowModel:
+    """Predator-prey + harvesting + seasonal forcing (semantic pressure)."""
+    return StockFlowModel(
+        name="Ecosystem Management",
+        stocks=[
+            Stock(name="Prey", initial=500.0),
+            Stock(name="Predator", initial=50.0),
+        ],
+        flows=[
+            Flow(name="Prey Reproduction", target="Prey"),
+            Flow(name="Predation Loss", source="Prey"),
+            Flow(name="Harvest", source="Prey"),
+            Flow(name="Predator Reproduction", target="Predator"),
+            Flow(name="Predator Starvation", source="Predator"),
+        ],
+        auxiliaries=[
+            # Endogenous: prey growth depends on prey density
+            Auxiliary(name="Prey Growth Rate", inputs=["Prey"]),
+            # Coupling: predation depends on both populations
+            Auxiliary(name="Predation Rate", inputs=["Prey", "Predator"]),
+            # Exogenous: harvest depends on prey + seasonal quota
+            Auxiliary(
+                name="Harvest Rate",
+                inputs=["Prey", "Season"],
+            ),
+            # Coupling: predator growth depends on prey availability
+            Auxiliary(
+                name="Predator Growth Rate",
+                inputs=["Predator", "Prey"],
+            ),
+            # Endogenous: starvation depends on predator density + carrying capacity
+            Auxiliary(
+                name="Starvation Rate",
+                inputs=["Predator", "Carrying Capacity"],
+            ),
+        ],
+        converters=[
+            Converter(name="Season"),
+            Converter(name="Carrying Capacity"),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def compiled_models(
+    population_model: StockFlowModel,
+    two_stock_model: StockFlowModel,
+    predator_prey_model: StockFlowModel,
+    population_dynamics_model: StockFlowModel,
+    sir_model: StockFlowModel,
+    branching_model: StockFlowModel,
+    ecosystem_model: StockFlowModel,
+) -> dict[str, tuple[GDSSpec, CanonicalGDS]]:
+    """Name → (spec, canonical) for every shared model, compiled in one loop."""
+    models = {
+        "population": population_model,
+        "two_stock": two_stock_model,
+        "predator_prey": predator_prey_model,
+        "population_dynamics": population_dynamics_model,
+        "sir": sir_model,
+        "branching": branching_model,
+        "ecosystem": ecosystem_model,
+    }
+    compiled = {}
+    for name, model in models.items():
+        spec = compile_model(model)
+        compiled[name] = (spec, project_canonical(spec))
+    return compiled
+
+
+@pytest.fixture(scope="session")
+def population_spec(
+    compiled_models: dict[str, tuple[GDSSpec, CanonicalGDS]],
+) -> GDSSpec:
+    return compiled_models["population"][0]
+
+
+@pytest.fixture(scope="session")
+def population_ir(population_model: StockFlowModel) -> SystemIR:
+    return compile_to_system(population_model)
+
+
+@pytest.fixture(scope="session")
+def predator_prey_spec(
+    compiled_models: dict[str, tuple[GDSSpec, CanonicalGDS]],
+) -> GDSSpec:
+    return compiled_models["predator_prey"][0]
+
+
+@pytest.fixture(scope="session")
+def predator_prey_canonical(
+    compiled_models: dict[str, tuple[GDSSpec, CanonicalGDS]],
+) -> CanonicalGDS:
+    return compiled_models["predator_prey"][1]
+
+
+@pytest.fixture(scope="session")
+def predator_prey_ir(predator_prey_model: StockFlowModel) -> SystemIR:
+    return compile_to_system(predator_prey_model)
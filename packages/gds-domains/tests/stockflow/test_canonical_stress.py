@@ -13,18 +13,64 @@ Three categories:
   3. Scale — does the decomposition stay clean at realistic size?
 """
 
+import functools
+from collections.abc import Callable
+from typing import NamedTuple
+
 import pytest
 
 from gds.blocks.roles import BoundaryAction, Mechanism, Policy
 from gds.canonical import CanonicalGDS, project_canonical
+from gds.spec import GDSSpec
+from gds.types.interface import Interface
 from gds_domains.stockflow.dsl.compile import compile_model
 from gds_domains.stockflow.dsl.elements import Auxiliary, Converter, Flow, Stock
 from gds_domains.stockflow.dsl.model import StockFlowModel
 
 
+def _spec(model: StockFlowModel) -> GDSSpec:
+    """Shorthand: model → spec."""
+    return compile_model(model)
+
+
+def _canonical_from_spec(spec: GDSSpec) -> CanonicalGDS:
+    """Shorthand: spec → canonical."""
+    return project_canonical(spec)
+
+
 def _canonical(model: StockFlowModel) -> CanonicalGDS:
     """Shorthand: model → spec → canonical."""
-    return project_canonical(compile_model(model))
+    return _canonical_from_spec(_spec(model))
+
+
+def _state_set(canonical: CanonicalGDS) -> frozenset[tuple[str, str]]:
+    """``canonical.state_variables`` as a set."""
+    return frozenset(canonical.state_variables)
+
+
+class _UpdateMapSummary(NamedTuple):
+    """Everything the update-map invariants need, from a single pass."""
+
+    owners: dict[tuple[str, str], str]  # (entity, var) → first mechanism
+    duplicates: tuple[tuple[str, str], ...]  # targets updated more than once
+
+
+def _summarize_update_map(canonical: CanonicalGDS) -> _UpdateMapSummary:
+    owners: dict[tuple[str, str], str] = {}
+    duplicates: list[tuple[str, str]] = []
+    for mech_name, targets in canonical.update_map:
+        for pair in targets:
+            if pair in owners:
+                duplicates.append(pair)
+            else:
+                owners[pair] = mech_name
+    return _UpdateMapSummary(owners, tuple(duplicates))
+
+
+@functools.cache
+def _port_names(interface: Interface) -> frozenset[str]:
+    """Names of an interface's forward_in ports (interfaces are frozen)."""
+    return frozenset(p.name for p in interface.forward_in)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -40,8 +86,9 @@ class TestMultiStockMutualFeedback:
     coherent state vector and clear dependency structure.
     """
 
-    @pytest.fixture
-    def model(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def model(cls):
         return StockFlowModel(
             name="Coupled Stocks",
             stocks=[
@@ -63,13 +110,14 @@ class TestMultiStockMutualFeedback:
             ],
         )
 
-    @pytest.fixture
-    def canonical(self, model):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical(cls, model):
         return _canonical(model)
 
     def test_state_vector_is_coherent(self, canonical):
         """X = {(A, level), (B, level)} — one entry per stock."""
-        assert set(canonical.state_variables) == {("A", "level"), ("B", "level")}
+        assert _state_set(canonical) == {("A", "level"), ("B", "level")}
 
     def test_no_boundary_inputs(self, canonical):
         """No converters → U is empty."""
@@ -85,11 +133,9 @@ class TestMultiStockMutualFeedback:
 
     def test_update_map_covers_all_state(self, canonical):
         """Every state variable is updated by exactly one mechanism."""
-        updated_vars = set()
-        for _mech_name, targets in canonical.update_map:
-            for entity, var in targets:
-                updated_vars.add((entity, var))
-        assert updated_vars == set(canonical.state_variables)
+        summary = _summarize_update_map(canonical)
+        assert not summary.duplicates
+        assert summary.owners.keys() == _state_set(canonical)
 
     def test_decision_ports_cover_all_policies(self, canonical):
         """Every policy emits at least one decision port."""
@@ -104,8 +150,9 @@ class TestManyToOneAggregation:
     Tests whether canonical f properly reflects multi-source aggregation.
     """
 
-    @pytest.fixture
-    def model(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def model(cls):
         return StockFlowModel(
             name="Reservoir",
             stocks=[Stock(name="Water", initial=1000.0)],
@@ -123,9 +170,15 @@ class TestManyToOneAggregation:
             ],
         )
 
-    @pytest.fixture
-    def canonical(self, model):
-        return _canonical(model)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def spec(cls, model):
+        return _spec(model)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical(cls, spec):
+        return _canonical_from_spec(spec)
 
     def test_single_state_variable(self, canonical):
         assert canonical.state_variables == (("Water", "level"),)
@@ -135,9 +188,8 @@ class TestManyToOneAggregation:
         assert len(canonical.mechanism_blocks) == 1
         assert "Water Accumulation" in canonical.mechanism_blocks
 
-    def test_mechanism_receives_all_rates(self, model):
+    def test_mechanism_receives_all_rates(self, spec):
         """The mechanism's forward_in has 4 rate ports (one per flow)."""
-        spec = compile_model(model)
         mech = spec.blocks["Water Accumulation"]
         assert isinstance(mech, Mechanism)
         assert len(mech.interface.forward_in) == 4
@@ -162,8 +214,9 @@ class TestExogenousEndogenousMixing:
     - No leakage between the two.
     """
 
-    @pytest.fixture
-    def model(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def model(cls):
         return StockFlowModel(
             name="Mixed Inputs",
             stocks=[Stock(name="Population", initial=1000.0)],
@@ -182,9 +235,15 @@ class TestExogenousEndogenousMixing:
             ],
         )
 
-    @pytest.fixture
-    def canonical(self, model):
-        return _canonical(model)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def spec(cls, model):
+        return _spec(model)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical(cls, spec):
+        return _canonical_from_spec(spec)
 
     def test_boundary_separation(self, canonical):
         """Converters are classified as boundary (U), not policy (g)."""
@@ -199,11 +258,10 @@ class TestExogenousEndogenousMixing:
         input_blocks = {block for block, _port in canonical.input_ports}
         assert input_blocks == set(canonical.boundary_blocks)
 
-    def test_policy_reads_both_sources(self, model):
+    def test_policy_reads_both_sources(self, spec):
         """Auxiliary blocks have ports from both stocks and converters."""
-        spec = compile_model(model)
         birth_rate = spec.blocks["Birth Rate"]
-        port_names = {p.name for p in birth_rate.interface.forward_in}
+        port_names = _port_names(birth_rate.interface)
         # Population Level (endogenous) + Fertility Signal (exogenous)
         assert "Population Level" in port_names
         assert "Fertility Signal" in port_names
@@ -213,9 +271,8 @@ class TestExogenousEndogenousMixing:
         assert canonical.has_parameters
         assert "θ" in canonical.formula()
 
-    def test_block_roles_in_spec(self, model):
+    def test_block_roles_in_spec(self, spec):
         """Verify role classification at the spec level matches canonical."""
-        spec = compile_model(model)
         for name, block in spec.blocks.items():
             if isinstance(block, BoundaryAction):
                 assert name in {"Fertility", "Healthcare"}
@@ -243,8 +300,9 @@ class TestFlowWithNoAuxiliaryLayer:
     Does the canonical decomposition still produce interpretable g and f?
     """
 
-    @pytest.fixture
-    def model(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def model(cls):
         return StockFlowModel(
             name="Direct Transfer",
             stocks=[
@@ -256,12 +314,13 @@ class TestFlowWithNoAuxiliaryLayer:
             ],
         )
 
-    @pytest.fixture
-    def canonical(self, model):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical(cls, model):
         return _canonical(model)
 
     def test_state_vector(self, canonical):
-        assert set(canonical.state_variables) == {
+        assert _state_set(canonical) == {
             ("Source", "level"),
             ("Sink", "level"),
         }
@@ -297,8 +356,9 @@ class TestNonNegativeConstraintVisibility:
     live in TypeDef at the spec level. This test documents that boundary.
     """
 
-    @pytest.fixture
-    def constrained_model(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def constrained_model(cls):
         return StockFlowModel(
             name="Constrained",
             stocks=[Stock(name="S", initial=10.0, non_negative=True)],
@@ -306,8 +366,9 @@ class TestNonNegativeConstraintVisibility:
             auxiliaries=[Auxiliary(name="Rate", inputs=["S"])],
         )
 
-    @pytest.fixture
-    def unconstrained_model(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def unconstrained_model(cls):
         return StockFlowModel(
             name="Unconstrained",
             stocks=[Stock(name="S", initial=10.0, non_negative=False)],
@@ -315,10 +376,22 @@ class TestNonNegativeConstraintVisibility:
             auxiliaries=[Auxiliary(name="Rate", inputs=["S"])],
         )
 
-    def test_canonical_identical(self, constrained_model, unconstrained_model):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def compiled(cls, constrained_model, unconstrained_model):
+        """(spec_c, spec_u, canonical_c, canonical_u) — one compile per model."""
+        spec_c = _spec(constrained_model)
+        spec_u = _spec(unconstrained_model)
+        return (
+            spec_c,
+            spec_u,
+            _canonical_from_spec(spec_c),
+            _canonical_from_spec(spec_u),
+        )
+
+    def test_canonical_identical(self, compiled):
         """Canonical decomposition is identical regardless of non_negative."""
-        c1 = _canonical(constrained_model)
-        c2 = _canonical(unconstrained_model)
+        _, _, c1, c2 = compiled
 
         assert c1.state_variables == c2.state_variables
         assert c1.boundary_blocks == c2.boundary_blocks
@@ -326,12 +399,9 @@ class TestNonNegativeConstraintVisibility:
         assert c1.mechanism_blocks == c2.mechanism_blocks
         assert c1.update_map == c2.update_map
 
-    def test_constraint_lives_in_spec_types(
-        self, constrained_model, unconstrained_model
-    ):
+    def test_constraint_lives_in_spec_types(self, compiled):
         """The constraint difference is visible at spec level, not canonical."""
-        spec_c = compile_model(constrained_model)
-        spec_u = compile_model(unconstrained_model)
+        spec_c, spec_u, can_c, can_u = compiled
 
         # Spec-level: different types registered
         assert "Level" in spec_c.types  # non-negative
@@ -344,8 +414,6 @@ class TestNonNegativeConstraintVisibility:
         assert u_typedef.name == "UnconstrainedLevel"
 
         # But canonical sees the same (entity, variable) pair either way
-        can_c = project_canonical(spec_c)
-        can_u = project_canonical(spec_u)
         assert can_c.state_variables == can_u.state_variables
 
 
@@ -356,12 +424,14 @@ class TestOrphanStockCanonical:
     This is the degenerate case: h = f ∘ g where g is trivial.
     """
 
-    @pytest.fixture
-    def model(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def model(cls):
         return StockFlowModel(name="Static", stocks=[Stock(name="X", initial=42.0)])
 
-    @pytest.fixture
-    def canonical(self, model):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical(cls, model):
         return _canonical(model)
 
     def test_state_exists(self, canonical):
@@ -392,8 +462,9 @@ class TestLargeModel:
     Tests that canonical decomposition stays clean at realistic scale.
     """
 
-    @pytest.fixture
-    def model(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def model(cls):
         return StockFlowModel(
             name="Supply Chain",
             stocks=[
@@ -438,9 +509,15 @@ class TestLargeModel:
             ],
         )
 
-    @pytest.fixture
-    def canonical(self, model):
-        return _canonical(model)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def spec(cls, model):
+        return _spec(model)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical(cls, spec):
+        return _canonical_from_spec(spec)
 
     def test_state_vector_size(self, canonical):
         """X has 5 entries — one per stock."""
@@ -454,7 +531,7 @@ class TestLargeModel:
             ("In Transit", "level"),
             ("Delivered", "level"),
         }
-        assert set(canonical.state_variables) == expected
+        assert _state_set(canonical) == expected
 
     def test_boundary_blocks(self, canonical):
         """3 converters → 3 boundary blocks."""
@@ -474,18 +551,12 @@ class TestLargeModel:
 
     def test_update_map_complete(self, canonical):
         """Every state variable has exactly one updating mechanism."""
-        updated = set()
-        for _mech, targets in canonical.update_map:
-            for pair in targets:
-                updated.add(pair)
-        assert updated == set(canonical.state_variables)
+        summary = _summarize_update_map(canonical)
+        assert summary.owners.keys() == _state_set(canonical)
 
     def test_no_duplicate_update_targets(self, canonical):
         """No state variable is updated by more than one mechanism."""
-        all_targets = []
-        for _mech, targets in canonical.update_map:
-            all_targets.extend(targets)
-        assert len(all_targets) == len(set(all_targets))
+        assert not _summarize_update_map(canonical).duplicates
 
     def test_decision_port_count(self, canonical):
         """Each policy emits exactly one decision port → 14 total."""
@@ -496,9 +567,8 @@ class TestLargeModel:
         assert canonical.has_parameters
         assert len(canonical.parameter_schema) == 3
 
-    def test_role_partition_is_exhaustive(self, canonical, model):
+    def test_role_partition_is_exhaustive(self, canonical, spec):
         """Every block in the spec is classified into exactly one role."""
-        spec = compile_model(model)
         all_canonical = (
             set(canonical.boundary_blocks)
             | set(canonical.policy_blocks)
@@ -506,17 +576,16 @@ class TestLargeModel:
         )
         assert all_canonical == set(spec.blocks.keys())
 
-    def test_inter_stock_flows_share_mechanisms(self, model):
+    def test_inter_stock_flows_share_mechanisms(self, spec):
         """Production Start sources Raw Materials and targets WIP.
 
         Both mechanisms should have the same rate port.
         """
-        spec = compile_model(model)
         rm_mech = spec.blocks["Raw Materials Accumulation"]
         wip_mech = spec.blocks["WIP Accumulation"]
 
-        rm_ports = {p.name for p in rm_mech.interface.forward_in}
-        wip_ports = {p.name for p in wip_mech.interface.forward_in}
+        rm_ports = _port_names(rm_mech.interface)
+        wip_ports = _port_names(wip_mech.interface)
 
         # "Production Start Rate" should appear in both
         assert "Production Start Rate" in rm_ports
@@ -528,129 +597,122 @@ class TestLargeModel:
 # ═══════════════════════════════════════════════════════════════
 
 
+# Factories, not instances: the ``model`` fixture builds each one on first
+# use, so runs that deselect the invariant tests never construct them.
+_INVARIANT_MODELS: dict[str, Callable[[], StockFlowModel]] = {
+    # Minimal
+    "M1": lambda: StockFlowModel(name="M1", stocks=[Stock(name="X", initial=1.0)]),
+    # Simple
+    "M2": lambda: StockFlowModel(
+        name="M2",
+        stocks=[Stock(name="X", initial=1.0)],
+        flows=[Flow(name="F", target="X")],
+    ),
+    # With auxiliary
+    "M3": lambda: StockFlowModel(
+        name="M3",
+        stocks=[Stock(name="X", initial=1.0)],
+        flows=[Flow(name="F", target="X")],
+        auxiliaries=[Auxiliary(name="A", inputs=["X"])],
+    ),
+    # With converter
+    "M4": lambda: StockFlowModel(
+        name="M4",
+        stocks=[Stock(name="X", initial=1.0)],
+        flows=[Flow(name="F", target="X")],
+        auxiliaries=[Auxiliary(name="A", inputs=["X", "C"])],
+        converters=[Converter(name="C")],
+    ),
+    # Multi-stock
+    "M5": lambda: StockFlowModel(
+        name="M5",
+        stocks=[
+            Stock(name="X", initial=1.0),
+            Stock(name="Y", initial=2.0),
+        ],
+        flows=[Flow(name="F", source="X", target="Y")],
+    ),
+}
+
+
 class TestCanonicalInvariants:
     """Properties that must hold for any well-formed StockFlow model.
 
     These are not model-specific — they test the decomposition contract.
     """
 
-    MODELS = [
-        # Minimal
-        StockFlowModel(name="M1", stocks=[Stock(name="X", initial=1.0)]),
-        # Simple
-        StockFlowModel(
-            name="M2",
-            stocks=[Stock(name="X", initial=1.0)],
-            flows=[Flow(name="F", target="X")],
-        ),
-        # With auxiliary
-        StockFlowModel(
-            name="M3",
-            stocks=[Stock(name="X", initial=1.0)],
-            flows=[Flow(name="F", target="X")],
-            auxiliaries=[Auxiliary(name="A", inputs=["X"])],
-        ),
-        # With converter
-        StockFlowModel(
-            name="M4",
-            stocks=[Stock(name="X", initial=1.0)],
-            flows=[Flow(name="F", target="X")],
-            auxiliaries=[Auxiliary(name="A", inputs=["X", "C"])],
-            converters=[Converter(name="C")],
-        ),
-        # Multi-stock
-        StockFlowModel(
-            name="M5",
-            stocks=[
-                Stock(name="X", initial=1.0),
-                Stock(name="Y", initial=2.0),
-            ],
-            flows=[Flow(name="F", source="X", target="Y")],
-        ),
-    ]
+    @pytest.fixture(scope="class", params=list(_INVARIANT_MODELS))
+    @classmethod
+    def model(cls, request):
+        return _INVARIANT_MODELS[request.param]()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def spec(cls, model):
+        return _spec(model)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical(cls, spec):
+        return _canonical_from_spec(spec)
 
-    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.name)
-    def test_state_variables_equal_stocks(self, model):
+    def test_state_variables_equal_stocks(self, model, canonical):
         """len(X) == len(stocks), always."""
-        c = _canonical(model)
-        assert len(c.state_variables) == len(model.stocks)
+        assert len(canonical.state_variables) == len(model.stocks)
 
-    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.name)
-    def test_mechanisms_equal_stocks(self, model):
+    def test_mechanisms_equal_stocks(self, model, canonical):
         """One mechanism per stock, always."""
-        c = _canonical(model)
-        assert len(c.mechanism_blocks) == len(model.stocks)
+        assert len(canonical.mechanism_blocks) == len(model.stocks)
 
-    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.name)
-    def test_boundary_blocks_equal_converters(self, model):
+    def test_boundary_blocks_equal_converters(self, model, canonical):
         """Converters → BoundaryActions, one-to-one."""
-        c = _canonical(model)
-        assert len(c.boundary_blocks) == len(model.converters)
+        assert len(canonical.boundary_blocks) == len(model.converters)
 
-    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.name)
-    def test_policies_equal_aux_plus_flows(self, model):
+    def test_policies_equal_aux_plus_flows(self, model, canonical):
         """Policies = auxiliaries + flows."""
-        c = _canonical(model)
-        assert len(c.policy_blocks) == len(model.auxiliaries) + len(model.flows)
+        assert len(canonical.policy_blocks) == len(model.auxiliaries) + len(model.flows)
 
-    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.name)
-    def test_update_map_covers_state(self, model):
+    def test_update_map_covers_state(self, canonical):
         """Every state variable is targeted by the update map."""
-        c = _canonical(model)
-        updated = set()
-        for _mech, targets in c.update_map:
-            for pair in targets:
-                updated.add(pair)
-        assert updated == set(c.state_variables)
-
-    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.name)
-    def test_role_partition_complete(self, model):
+        assert _summarize_update_map(canonical).owners.keys() == _state_set(canonical)
+
+    def test_role_partition_complete(self, spec, canonical):
         """boundary ∪ policy ∪ mechanism = all blocks (no gaps, no overlaps)."""
-        c = _canonical(model)
-        spec = compile_model(model)
         classified = (
-            set(c.boundary_blocks) | set(c.policy_blocks) | set(c.mechanism_blocks)
+            set(canonical.boundary_blocks)
+            | set(canonical.policy_blocks)
+            | set(canonical.mechanism_blocks)
         )
         assert classified == set(spec.blocks.keys())
 
-    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.name)
-    def test_no_control_actions(self, model):
+    def test_no_control_actions(self, canonical):
         """StockFlow never produces ControlAction blocks."""
-        c = _canonical(model)
-        assert len(c.control_blocks) == 0
+        assert len(canonical.control_blocks) == 0
 
-    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.name)
-    def test_role_partition_disjoint(self, model):
+    def test_role_partition_disjoint(self, canonical):
         """boundary ∩ policy ∩ mechanism = ∅ — no block in two roles."""
-        c = _canonical(model)
-        b = set(c.boundary_blocks)
-        p = set(c.policy_blocks)
-        m = set(c.mechanism_blocks)
+        b = set(canonical.boundary_blocks)
+        p = set(canonical.policy_blocks)
+        m = set(canonical.mechanism_blocks)
         assert not (b & p), f"boundary ∩ policy: {b & p}"
         assert not (b & m), f"boundary ∩ mechanism: {b & m}"
         assert not (p & m), f"policy ∩ mechanism: {p & m}"
 
-    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.name)
-    def test_no_state_leaks_into_policy(self, model):
+    def test_no_state_leaks_into_policy(self, model, canonical):
         """No stock-generated block appears in policy_blocks."""
-        c = _canonical(model)
         stock_accumulators = {f"{s.name} Accumulation" for s in model.stocks}
-        assert not stock_accumulators & set(c.policy_blocks)
+        assert not stock_accumulators & set(canonical.policy_blocks)
 
-    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.name)
-    def test_no_stock_in_boundary(self, model):
+    def test_no_stock_in_boundary(self, model, canonical):
         """No stock accidentally classified as boundary."""
-        c = _canonical(model)
         stock_names = {s.name for s in model.stocks}
         stock_accumulators = {f"{s.name} Accumulation" for s in model.stocks}
-        assert not stock_names & set(c.boundary_blocks)
-        assert not stock_accumulators & set(c.boundary_blocks)
+        assert not stock_names & set(canonical.boundary_blocks)
+        assert not stock_accumulators & set(canonical.boundary_blocks)
 
-    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.name)
-    def test_decision_port_count_equals_policies(self, model):
+    def test_decision_port_count_equals_policies(self, canonical):
         """Each policy emits exactly one forward_out → |D| == |g|."""
-        c = _canonical(model)
-        assert len(c.decision_ports) == len(c.policy_blocks)
+        assert len(canonical.decision_ports) == len(canonical.policy_blocks)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -665,8 +727,9 @@ class TestDeclarationOrderIndependence:
     If canonical differs, execution order is leaking into projection.
     """
 
-    @pytest.fixture
-    def model_forward(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def model_forward(cls):
         """Stocks, flows, auxiliaries declared in natural order."""
         return StockFlowModel(
             name="Forward",
@@ -688,8 +751,9 @@ class TestDeclarationOrderIndependence:
             ],
         )
 
-    @pytest.fixture
-    def model_reversed(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def model_reversed(cls):
         """Same model, every list reversed."""
         return StockFlowModel(
             name="Reversed",
@@ -711,36 +775,42 @@ class TestDeclarationOrderIndependence:
             ],
         )
 
-    def test_state_variables_identical(self, model_forward, model_reversed):
-        c_fwd = _canonical(model_forward)
-        c_rev = _canonical(model_reversed)
-        assert set(c_fwd.state_variables) == set(c_rev.state_variables)
-
-    def test_boundary_blocks_identical(self, model_forward, model_reversed):
-        c_fwd = _canonical(model_forward)
-        c_rev = _canonical(model_reversed)
-        assert set(c_fwd.boundary_blocks) == set(c_rev.boundary_blocks)
-
-    def test_policy_blocks_identical(self, model_forward, model_reversed):
-        c_fwd = _canonical(model_forward)
-        c_rev = _canonical(model_reversed)
-        assert set(c_fwd.policy_blocks) == set(c_rev.policy_blocks)
-
-    def test_mechanism_blocks_identical(self, model_forward, model_reversed):
-        c_fwd = _canonical(model_forward)
-        c_rev = _canonical(model_reversed)
-        assert set(c_fwd.mechanism_blocks) == set(c_rev.mechanism_blocks)
-
-    def test_decision_ports_identical(self, model_forward, model_reversed):
-        c_fwd = _canonical(model_forward)
-        c_rev = _canonical(model_reversed)
-        assert set(c_fwd.decision_ports) == set(c_rev.decision_ports)
-
-    def test_update_map_identical(self, model_forward, model_reversed):
-        c_fwd = _canonical(model_forward)
-        c_rev = _canonical(model_reversed)
-        fwd_map = {n: t for n, t in c_fwd.update_map}
-        rev_map = {n: t for n, t in c_rev.update_map}
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical_forward(cls, model_forward):
+        return _canonical(model_forward)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical_reversed(cls, model_reversed):
+        return _canonical(model_reversed)
+
+    def test_state_variables_identical(self, canonical_forward, canonical_reversed):
+        assert _state_set(canonical_forward) == _state_set(canonical_reversed)
+
+    def test_boundary_blocks_identical(self, canonical_forward, canonical_reversed):
+        assert set(canonical_forward.boundary_blocks) == set(
+            canonical_reversed.boundary_blocks
+        )
+
+    def test_policy_blocks_identical(self, canonical_forward, canonical_reversed):
+        assert set(canonical_forward.policy_blocks) == set(
+            canonical_reversed.policy_blocks
+        )
+
+    def test_mechanism_blocks_identical(self, canonical_forward, canonical_reversed):
+        assert set(canonical_forward.mechanism_blocks) == set(
+            canonical_reversed.mechanism_blocks
+        )
+
+    def test_decision_ports_identical(self, canonical_forward, canonical_reversed):
+        assert set(canonical_forward.decision_ports) == set(
+            canonical_reversed.decision_ports
+        )
+
+    def test_update_map_identical(self, canonical_forward, canonical_reversed):
+        fwd_map = {n: t for n, t in canonical_forward.update_map}
+        rev_map = {n: t for n, t in canonical_reversed.update_map}
         assert fwd_map == rev_map
 
 
@@ -760,8 +830,9 @@ class TestCouplingFidelity:
     - No cross-stock contamination in the update map
     """
 
-    @pytest.fixture
-    def model(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def model(cls):
         return StockFlowModel(
             name="Coupled Transfer",
             stocks=[
@@ -777,23 +848,27 @@ class TestCouplingFidelity:
             ],
         )
 
-    @pytest.fixture
-    def canonical(self, model):
-        return _canonical(model)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def spec(cls, model):
+        return _spec(model)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical(cls, spec):
+        return _canonical_from_spec(spec)
 
     def test_both_stocks_in_state(self, canonical):
-        assert set(canonical.state_variables) == {
+        assert _state_set(canonical) == {
             ("Tank A", "level"),
             ("Tank B", "level"),
         }
 
-    def test_coupling_is_in_g_not_f(self, model):
+    def test_coupling_is_in_g_not_f(self, spec):
         """The auxiliary (g) reads both stocks. The mechanisms (f) don't cross."""
-        spec = compile_model(model)
-
         # g: Transfer Rate auxiliary reads both tank levels
         aux = spec.blocks["Transfer Rate"]
-        aux_ports = {p.name for p in aux.interface.forward_in}
+        aux_ports = _port_names(aux.interface)
         assert "Tank A Level" in aux_ports
         assert "Tank B Level" in aux_ports
 
@@ -813,15 +888,10 @@ class TestCouplingFidelity:
             # Mechanism name embeds the stock name it owns
             assert entity in mech_name
 
-    def test_shared_flow_appears_in_both_mechanisms(self, model):
+    def test_shared_flow_appears_in_both_mechanisms(self, spec):
         """Transfer Rate port appears in both mechanisms' forward_in."""
-        spec = compile_model(model)
-        a_ports = {
-            p.name for p in spec.blocks["Tank A Accumulation"].interface.forward_in
-        }
-        b_ports = {
-            p.name for p in spec.blocks["Tank B Accumulation"].interface.forward_in
-        }
+        a_ports = _port_names(spec.blocks["Tank A Accumulation"].interface)
+        b_ports = _port_names(spec.blocks["Tank B Accumulation"].interface)
         assert "Transfer Rate" in a_ports
         assert "Transfer Rate" in b_ports
 
@@ -831,6 +901,19 @@ class TestCouplingFidelity:
 # ═══════════════════════════════════════════════════════════════
 
 
+_BRANCHING_POLICIES = {
+    # Auxiliaries
+    "Radiation",
+    "Absorption",
+    "Gradient",
+    # Flows
+    "Heat Loss",
+    "Heat Gain",
+    "Exchange",
+}
+
+
+@pytest.mark.xdist_group(name="TestOverCollapsing")
 class TestOverCollapsing:
     """Canonical projection must not merge distinct policies or lose
     intermediate structure.
@@ -840,75 +923,44 @@ class TestOverCollapsing:
     branch. Tests whether canonical preserves branching.
     """
 
-    @pytest.fixture
-    def model(self):
-        return StockFlowModel(
-            name="Branching",
-            stocks=[
-                Stock(name="Hot", initial=80.0),
-                Stock(name="Cold", initial=20.0),
-            ],
-            flows=[
-                Flow(name="Heat Loss", source="Hot"),
-                Flow(name="Heat Gain", target="Cold"),
-                Flow(name="Exchange", source="Hot", target="Cold"),
-            ],
-            auxiliaries=[
-                # Branch A: reads Hot only
-                Auxiliary(name="Radiation", inputs=["Hot"]),
-                # Branch B: reads Cold only
-                Auxiliary(name="Absorption", inputs=["Cold", "Ambient"]),
-                # Cross-branch: reads both
-                Auxiliary(name="Gradient", inputs=["Hot", "Cold"]),
-            ],
-            converters=[
-                Converter(name="Ambient"),
-            ],
-        )
-
-    @pytest.fixture
-    def canonical(self, model):
-        return _canonical(model)
-
-    def test_all_auxiliaries_are_distinct_policies(self, canonical):
-        """Three auxiliaries must remain three distinct policies."""
-        aux_names = {"Radiation", "Absorption", "Gradient"}
-        assert aux_names <= set(canonical.policy_blocks)
-
-    def test_flows_are_distinct_policies(self, canonical):
-        """Three flows must remain three distinct policies."""
-        flow_names = {"Heat Loss", "Heat Gain", "Exchange"}
-        assert flow_names <= set(canonical.policy_blocks)
-
-    def test_total_policy_count(self, canonical):
-        """3 aux + 3 flows = 6 policies. No collapsing."""
-        assert len(canonical.policy_blocks) == 6
-
-    def test_decision_ports_not_collapsed(self, canonical):
-        """Each policy has its own decision port — 6 total."""
-        assert len(canonical.decision_ports) == 6
-        blocks_with_ports = {b for b, _p in canonical.decision_ports}
-        assert len(blocks_with_ports) == 6
-
-    def test_boundary_is_minimal(self, canonical):
-        """Only the converter is boundary. Not duplicated."""
-        assert set(canonical.boundary_blocks) == {"Ambient"}
-        assert len(canonical.input_ports) == 1
-
-    def test_converter_not_duplicated_in_ports(self, canonical):
-        """One converter → one input port. No inflation."""
-        input_blocks = [b for b, _p in canonical.input_ports]
-        assert input_blocks == ["Ambient"]
-
-    def test_asymmetric_dependency_preserved(self, model):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical(cls, compiled_models):
+        return compiled_models["branching"][1]
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def spec(cls, compiled_models):
+        return compiled_models["branching"][0]
+
+    # 3 aux + 3 flows = 6 policies, each with its own decision port;
+    # the single converter is the only boundary block and input port.
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            pytest.param(attr, expected, id=attr)
+            for attr, expected in (
+                ("policy_blocks", _BRANCHING_POLICIES),
+                ("decision_ports", _BRANCHING_POLICIES),
+                ("boundary_blocks", {"Ambient"}),
+                ("input_ports", {"Ambient"}),
+            )
+        ],
+    )
+    def test_not_collapsed(self, canonical, attr, expected):
+        """One entry per source element — no merging, no inflation."""
+        entries = getattr(canonical, attr)
+        names = [e if isinstance(e, str) else e[0] for e in entries]
+        assert len(names) == len(expected)
+        assert set(names) == expected
+
+    def test_asymmetric_dependency_preserved(self, spec):
         """Radiation reads only Hot; Absorption reads Cold + Ambient.
 
         These are structurally different — canonical must not merge them.
         """
-        spec = compile_model(model)
-
-        rad_ports = {p.name for p in spec.blocks["Radiation"].interface.forward_in}
-        abs_ports = {p.name for p in spec.blocks["Absorption"].interface.forward_in}
+        rad_ports = _port_names(spec.blocks["Radiation"].interface)
+        abs_ports = _port_names(spec.blocks["Absorption"].interface)
 
         assert rad_ports == {"Hot Level"}
         assert abs_ports == {"Cold Level", "Ambient Signal"}
@@ -920,6 +972,7 @@ class TestOverCollapsing:
 # ═══════════════════════════════════════════════════════════════
 
 
+@pytest.mark.xdist_group(name="TestComplexPredatorPreyHarvesting")
 class TestComplexPredatorPreyHarvesting:
     """Predator-prey + harvesting + seasonal forcing.
 
@@ -931,60 +984,36 @@ class TestComplexPredatorPreyHarvesting:
     or do compression artifacts appear?
     """
 
-    @pytest.fixture
-    def model(self):
-        return StockFlowModel(
-            name="Ecosystem Management",
-            stocks=[
-                Stock(name="Prey", initial=500.0),
-                Stock(name="Predator", initial=50.0),
-            ],
-            flows=[
-                Flow(name="Prey Reproduction", target="Prey"),
-                Flow(name="Predation Loss", source="Prey"),
-                Flow(name="Harvest", source="Prey"),
-                Flow(name="Predator Reproduction", target="Predator"),
-                Flow(name="Predator Starvation", source="Predator"),
-            ],
-            auxiliaries=[
-                # Endogenous: prey growth depends on prey density
-                Auxiliary(name="Prey Growth Rate", inputs=["Prey"]),
-                # Coupling: predation depends on both populations
-                Auxiliary(name="Predation Rate", inputs=["Prey", "Predator"]),
-                # Exogenous: harvest depends on prey + seasonal quota
-                Auxiliary(
-                    name="Harvest Rate",
-                    inputs=["Prey", "Season"],
-                ),
-                # Coupling: predator growth depends on prey availability
-                Auxiliary(
-                    name="Predator Growth Rate",
-                    inputs=["Predator", "Prey"],
-                ),
-                # Endogenous: starvation depends on predator density + carrying capacity
-                Auxiliary(
-                    name="Starvation Rate",
-                    inputs=["Predator", "Carrying Capacity"],
-                ),
-            ],
-            converters=[
-                Converter(name="Season"),
-                Converter(name="Carrying Capacity"),
-            ],
-        )
+    @pytest.fixture(scope="class")
+    @classmethod
+    def canonical(cls, compiled_models):
+        return compiled_models["ecosystem"][1]
 
-    @pytest.fixture
-    def canonical(self, model):
-        return _canonical(model)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def spec(cls, compiled_models):
+        return compiled_models["ecosystem"][0]
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def port_index(cls, spec):
+        """Block name → forward_in port names, built once per class."""
+        return {name: _port_names(b.interface) for name, b in spec.blocks.items()}
 
-    @pytest.fixture
-    def spec(self, model):
-        return compile_model(model)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def update_dict(cls, canonical):
+        return dict(canonical.update_map)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def update_summary(cls, canonical):
+        return _summarize_update_map(canonical)
 
     # ── State integrity ──
 
     def test_state_vector(self, canonical):
-        assert set(canonical.state_variables) == {
+        assert _state_set(canonical) == {
             ("Prey", "level"),
             ("Predator", "level"),
         }
@@ -1032,53 +1061,45 @@ class TestComplexPredatorPreyHarvesting:
     def test_mechanism_count(self, canonical):
         assert len(canonical.mechanism_blocks) == 2
 
-    def test_prey_mechanism_aggregates_three_flows(self, spec):
+    def test_prey_mechanism_aggregates_three_flows(self, port_index):
         """Prey Accumulation receives: Prey Reproduction, Predation Loss, Harvest."""
-        mech = spec.blocks["Prey Accumulation"]
-        ports = {p.name for p in mech.interface.forward_in}
-        assert ports == {
+        assert port_index["Prey Accumulation"] == {
             "Prey Reproduction Rate",
             "Predation Loss Rate",
             "Harvest Rate",
         }
 
-    def test_predator_mechanism_aggregates_two_flows(self, spec):
+    def test_predator_mechanism_aggregates_two_flows(self, port_index):
         """Predator Accumulation receives: Predator Reproduction, Predator Starvation."""
-        mech = spec.blocks["Predator Accumulation"]
-        ports = {p.name for p in mech.interface.forward_in}
-        assert ports == {
+        assert port_index["Predator Accumulation"] == {
             "Predator Reproduction Rate",
             "Predator Starvation Rate",
         }
 
-    def test_update_map_no_cross_stock(self, canonical):
+    def test_update_map_no_cross_stock(self, update_dict):
         """Each mechanism updates only its own stock."""
-        update_dict = {name: targets for name, targets in canonical.update_map}
         assert update_dict["Prey Accumulation"] == (("Prey", "level"),)
         assert update_dict["Predator Accumulation"] == (("Predator", "level"),)
 
     # ── Coupling fidelity ──
 
-    def test_predation_rate_reads_both_stocks(self, spec):
+    def test_predation_rate_reads_both_stocks(self, port_index):
         """Cross-coupling in g: Predation Rate depends on Prey AND Predator."""
-        aux = spec.blocks["Predation Rate"]
-        ports = {p.name for p in aux.interface.forward_in}
+        ports = port_index["Predation Rate"]
         assert "Prey Level" in ports
         assert "Predator Level" in ports
 
-    def test_harvest_rate_reads_stock_and_boundary(self, spec):
+    def test_harvest_rate_reads_stock_and_boundary(self, port_index):
         """Mixed dependency: Harvest Rate depends on Prey (endogenous)
         and Season (exogenous)."""
-        aux = spec.blocks["Harvest Rate"]
-        ports = {p.name for p in aux.interface.forward_in}
+        ports = port_index["Harvest Rate"]
         assert "Prey Level" in ports
         assert "Season Signal" in ports
 
-    def test_starvation_reads_stock_and_boundary(self, spec):
+    def test_starvation_reads_stock_and_boundary(self, port_index):
         """Starvation Rate depends on Predator (endogenous)
         and Carrying Capacity (exogenous)."""
-        aux = spec.blocks["Starvation Rate"]
-        ports = {p.name for p in aux.interface.forward_in}
+        ports = port_index["Starvation Rate"]
         assert "Predator Level" in ports
         assert "Carrying Capacity Signal" in ports
 
@@ -1093,7 +1114,7 @@ class TestComplexPredatorPreyHarvesting:
 
     # ── The meta-question: is this still minimal? ──
 
-    def test_canonical_is_minimal(self, canonical):
+    def test_canonical_is_minimal(self, canonical, update_summary):
         """Verify the decomposition has no redundancy.
 
         Minimal means:
@@ -1113,9 +1134,7 @@ class TestComplexPredatorPreyHarvesting:
         assert len(canonical.control_blocks) == 0
 
         # No redundancy in update map
-        updated = set()
-        for _mech, targets in canonical.update_map:
-            for pair in targets:
-                assert pair not in updated, f"Duplicate update: {pair}"
-                updated.add(pair)
-        assert updated == set(canonical.state_variables)
+        assert not update_summary.duplicates, (
+            f"Duplicate updates: {update_summary.duplicates}"
+        )
+        assert update_summary.owners.keys() == _state_set(canonical)
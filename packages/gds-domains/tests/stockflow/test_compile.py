@@ -10,83 +10,44 @@ from gds_domains.stockflow.dsl.compile import (
     compile_model,
     compile_to_system,
 )
-from gds_domains.stockflow.dsl.elements import Auxiliary, Converter, Flow, Stock
+from gds_domains.stockflow.dsl.elements import Stock
 from gds_domains.stockflow.dsl.model import StockFlowModel
 
 
-@pytest.fixture
-def population_model():
-    return StockFlowModel(
-        name="Population",
-        stocks=[Stock(name="Population", initial=1000.0)],
-        flows=[
-            Flow(name="Births", target="Population"),
-            Flow(name="Deaths", source="Population"),
-        ],
-        auxiliaries=[
-            Auxiliary(name="Birth Rate", inputs=["Population", "Fertility"]),
-            Auxiliary(name="Death Rate", inputs=["Population"]),
-        ],
-        converters=[Converter(name="Fertility")],
-    )
-
-
-@pytest.fixture
-def two_stock_model():
-    return StockFlowModel(
-        name="Predator Prey",
-        stocks=[
-            Stock(name="Prey", initial=100.0),
-            Stock(name="Predator", initial=20.0),
-        ],
-        flows=[
-            Flow(name="Prey Births", target="Prey"),
-            Flow(name="Prey Deaths", source="Prey"),
-            Flow(name="Predator Births", target="Predator"),
-            Flow(name="Predator Deaths", source="Predator"),
-        ],
-    )
-
-
+@pytest.mark.xdist_group(name="TestCompileModel")
 class TestCompileModel:
-    def test_returns_gds_spec(self, population_model):
-        spec = compile_model(population_model)
-        assert isinstance(spec, GDSSpec)
-        assert spec.name == "Population"
-
-    def test_types_registered(self, population_model):
-        spec = compile_model(population_model)
-        assert "Level" in spec.types
-        assert "Rate" in spec.types
-        assert "Signal" in spec.types
-
-    def test_spaces_registered(self, population_model):
-        spec = compile_model(population_model)
-        assert "LevelSpace" in spec.spaces
-        assert "RateSpace" in spec.spaces
-        assert "SignalSpace" in spec.spaces
-
-    def test_entities_for_stocks(self, population_model):
-        spec = compile_model(population_model)
-        assert "Population" in spec.entities
-        entity = spec.entities["Population"]
+    def test_returns_gds_spec(self, population_spec):
+        assert isinstance(population_spec, GDSSpec)
+        assert population_spec.name == "Population"
+
+    def test_types_registered(self, population_spec):
+        assert "Level" in population_spec.types
+        assert "Rate" in population_spec.types
+        assert "Signal" in population_spec.types
+
+    def test_spaces_registered(self, population_spec):
+        assert "LevelSpace" in population_spec.spaces
+        assert "RateSpace" in population_spec.spaces
+        assert "SignalSpace" in population_spec.spaces
+
+    def test_entities_for_stocks(self, population_spec):
+        assert "Population" in population_spec.entities
+        entity = population_spec.entities["Population"]
         assert isinstance(entity, Entity)
         assert "level" in entity.variables
         assert entity.variables["level"].typedef == LevelType
 
-    def test_converter_becomes_boundary_action(self, population_model):
-        spec = compile_model(population_model)
-        assert "Fertility" in spec.blocks
-        block = spec.blocks["Fertility"]
+    def test_converter_becomes_boundary_action(self, population_spec):
+        assert "Fertility" in population_spec.blocks
+        block = population_spec.blocks["Fertility"]
         assert isinstance(block, BoundaryAction)
         assert block.interface.forward_in == ()
         assert len(block.interface.forward_out) == 1
         assert block.interface.forward_out[0].name == "Fertility Signal"
 
-    def test_auxiliary_becomes_policy(self, population_model):
-        spec = compile_model(population_model)
-        assert "Birth Rate" in spec.blocks
-        block = spec.blocks["Birth Rate"]
+    def test_auxiliary_becomes_policy(self, population_spec):
+        assert "Birth Rate" in population_spec.blocks
+        block = population_spec.blocks["Birth Rate"]
         assert isinstance(block, Policy)
         # Receives Population Level + Fertility Signal
         port_names = {p.name for p in block.interface.forward_in}
@@ -95,24 +56,21 @@ class TestCompileModel:
         # Emits Birth Rate Signal
         assert block.interface.forward_out[0].name == "Birth Rate Signal"
 
-    def test_flow_becomes_policy(self, population_model):
-        spec = compile_model(population_model)
-        assert "Deaths" in spec.blocks
-        block = spec.blocks["Deaths"]
+    def test_flow_becomes_policy(self, population_spec):
+        assert "Deaths" in population_spec.blocks
+        block = population_spec.blocks["Deaths"]
         assert isinstance(block, Policy)
         # Emits rate
         assert block.interface.forward_out[0].name == "Deaths Rate"
 
-    def test_flow_has_no_forward_in(self, population_model):
+    def test_flow_has_no_forward_in(self, population_spec):
         """Flow forward_in is empty — source stock level arrives via temporal loop."""
-        spec = compile_model(population_model)
-        deaths = spec.blocks["Deaths"]
+        deaths = population_spec.blocks["Deaths"]
         assert deaths.interface.forward_in == ()
 
-    def test_stock_becomes_mechanism(self, population_model):
-        spec = compile_model(population_model)
-        assert "Population Accumulation" in spec.blocks
-        block = spec.blocks["Population Accumulation"]
+    def test_stock_becomes_mechanism(self, population_spec):
+        assert "Population Accumulation" in population_spec.blocks
+        block = population_spec.blocks["Population Accumulation"]
         assert isinstance(block, Mechanism)
         # Receives rates from Births and Deaths
         port_names = {p.name for p in block.interface.forward_in}
@@ -123,15 +81,13 @@ class TestCompileModel:
         # Updates entity
         assert ("Population", "level") in block.updates
 
-    def test_wirings_registered(self, population_model):
-        spec = compile_model(population_model)
-        assert len(spec.wirings) == 1
-        wiring = list(spec.wirings.values())[0]
+    def test_wirings_registered(self, population_spec):
+        assert len(population_spec.wirings) == 1
+        wiring = list(population_spec.wirings.values())[0]
         assert len(wiring.wires) > 0
 
-    def test_parameters_registered(self, population_model):
-        spec = compile_model(population_model)
-        param_names = spec.parameter_schema.names()
+    def test_parameters_registered(self, population_spec):
+        param_names = population_spec.parameter_schema.names()
         assert "Fertility" in param_names
 
     def test_two_stocks(self, two_stock_model):
@@ -142,21 +98,19 @@ class TestCompileModel:
         assert "Predator Accumulation" in spec.blocks
 
 
+@pytest.mark.xdist_group(name="TestCompileToSystem")
 class TestCompileToSystem:
-    def test_returns_system_ir(self, population_model):
-        ir = compile_to_system(population_model)
-        assert ir.name == "Population"
-        assert len(ir.blocks) > 0
-        assert len(ir.wirings) > 0
+    def test_returns_system_ir(self, population_ir):
+        assert population_ir.name == "Population"
+        assert len(population_ir.blocks) > 0
+        assert len(population_ir.wirings) > 0
 
-    def test_block_count(self, population_model):
-        ir = compile_to_system(population_model)
+    def test_block_count(self, population_ir):
         # 1 converter + 2 auxiliaries + 2 flows + 1 mechanism = 6
-        assert len(ir.blocks) == 6
+        assert len(population_ir.blocks) == 6
 
-    def test_block_names(self, population_model):
-        ir = compile_to_system(population_model)
-        names = {b.name for b in ir.blocks}
+    def test_block_names(self, population_ir):
+        names = {b.name for b in population_ir.blocks}
         assert "Fertility" in names
         assert "Birth Rate" in names
         assert "Death Rate" in names
@@ -164,20 +118,18 @@ class TestCompileToSystem:
         assert "Deaths" in names
         assert "Population Accumulation" in names
 
-    def test_auto_wiring_connects_tiers(self, population_model):
-        ir = compile_to_system(population_model)
+    def test_auto_wiring_connects_tiers(self, population_ir):
         # Should have auto-wirings between tiers
-        assert len(ir.wirings) > 0
-        sources = {w.source for w in ir.wirings}
-        targets = {w.target for w in ir.wirings}
+        assert len(population_ir.wirings) > 0
+        sources = {w.source for w in population_ir.wirings}
+        targets = {w.target for w in population_ir.wirings}
         # Converter should feed something
         assert "Fertility" in sources
         # Mechanism should receive rates
         assert "Population Accumulation" in targets
 
-    def test_temporal_wirings_exist(self, population_model):
-        ir = compile_to_system(population_model)
-        temporal = [w for w in ir.wirings if w.is_temporal]
+    def test_temporal_wirings_exist(self, population_ir):
+        temporal = [w for w in population_ir.wirings if w.is_temporal]
         # Population → Birth Rate, Population → Death Rate (auxiliaries only)
         assert len(temporal) == 2
 
@@ -194,9 +146,8 @@ class TestCompileToSystem:
         ir = compile_to_system(two_stock_model)
         assert len(ir.blocks) == 6  # 4 flows + 2 mechanisms
 
-    def test_hierarchy_exists(self, population_model):
-        ir = compile_to_system(population_model)
-        assert ir.hierarchy is not None
+    def test_hierarchy_exists(self, population_ir):
+        assert population_ir.hierarchy is not None
 
     def test_method_delegation(self, population_model):
         """model.compile_system() delegates to compile_to_system()."""
@@ -10,6 +10,10 @@ Then asserts structural equivalence at three levels:
   3. SystemIR (block count, wiring count, temporal wirings)
 """
 
+import functools
+import operator
+from typing import NamedTuple
+
 import pytest
 
 from gds.blocks.composition import StackComposition, Wiring
@@ -19,7 +23,8 @@ from gds.compiler.compile import compile_system
 from gds.ir.models import FlowDirection
 from gds.spec import GDSSpec, SpecWiring, Wire
 from gds.state import Entity, StateVariable
-from gds.types.interface import Interface, port
+from gds.types.interface import Interface
+from gds.types.interface import port as _port
 from gds_domains.stockflow.dsl.compile import (
     LevelSpace,
     LevelType,
@@ -29,46 +34,74 @@ from gds_domains.stockflow.dsl.compile import (
     SignalType,
     UnconstrainedLevelSpace,
     UnconstrainedLevelType,
-    compile_model,
-    compile_to_system,
 )
-from gds_domains.stockflow.dsl.elements import Auxiliary, Flow, Stock
-from gds_domains.stockflow.dsl.model import StockFlowModel
+
+# Port is a frozen model, so one instance per name can be shared by every
+# interface that mentions it ("Prey Level" appears in four).
+port = functools.cache(_port)
 
 # ── Fixtures ────────────────────────────────────────────────────
 
+# (name, role, forward_in, forward_out, updates) for every hand-built block,
+# in the order the compiler registers them.
+_HAND_BLOCKS = (
+    # Auxiliaries
+    ("Prey Growth", Policy, ("Prey Level",), ("Prey Growth Signal",), ()),
+    (
+        "Predation",
+        Policy,
+        ("Prey Level", "Predator Level"),
+        ("Predation Signal",),
+        (),
+    ),
+    (
+        "Predator Growth",
+        Policy,
+        ("Predator Level", "Prey Level"),
+        ("Predator Growth Signal",),
+        (),
+    ),
+    ("Predator Decline", Policy, ("Predator Level",), ("Predator Decline Signal",), ()),
+    # Flows (no forward_in)
+    ("Prey Births", Policy, (), ("Prey Births Rate",), ()),
+    ("Prey Deaths", Policy, (), ("Prey Deaths Rate",), ()),
+    ("Predator Births", Policy, (), ("Predator Births Rate",), ()),
+    ("Predator Deaths", Policy, (), ("Predator Deaths Rate",), ()),
+    # Stock mechanisms
+    (
+        "Prey Accumulation",
+        Mechanism,
+        ("Prey Births Rate", "Prey Deaths Rate"),
+        ("Prey Level",),
+        (("Prey", "level"),),
+    ),
+    (
+        "Predator Accumulation",
+        Mechanism,
+        ("Predator Births Rate", "Predator Deaths Rate"),
+        ("Predator Level",),
+        (("Predator", "level"),),
+    ),
+)
 
-@pytest.fixture
-def predator_prey_model():
-    """The StockFlowModel DSL declaration."""
-    return StockFlowModel(
-        name="Predator Prey",
-        stocks=[
-            Stock(name="Prey", initial=100.0),
-            Stock(name="Predator", initial=20.0),
-        ],
-        flows=[
-            Flow(name="Prey Births", target="Prey"),
-            Flow(name="Prey Deaths", source="Prey"),
-            Flow(name="Predator Births", target="Predator"),
-            Flow(name="Predator Deaths", source="Predator"),
-        ],
-        auxiliaries=[
-            Auxiliary(name="Prey Growth", inputs=["Prey"]),
-            Auxiliary(name="Predation", inputs=["Prey", "Predator"]),
-            Auxiliary(name="Predator Growth", inputs=["Predator", "Prey"]),
-            Auxiliary(name="Predator Decline", inputs=["Predator"]),
-        ],
-    )
+_BLOCK_NAMES = tuple(name for name, *_ in _HAND_BLOCKS)
+_MECHANISM_NAMES = tuple(name for name, role, *_ in _HAND_BLOCKS if role is Mechanism)
+# Auxiliaries read stock levels; flows are the policies with no forward_in.
+_AUX_NAMES = tuple(
+    name for name, role, fin, *_ in _HAND_BLOCKS if role is Policy and fin
+)
+_FLOW_NAMES = tuple(
+    name for name, role, fin, *_ in _HAND_BLOCKS if role is Policy and not fin
+)
 
 
-@pytest.fixture
-def dsl_spec(predator_prey_model):
-    """Path A: DSL-compiled GDSSpec."""
-    return compile_model(predator_prey_model)
+@pytest.fixture(scope="module")
+def dsl_spec(predator_prey_spec):
+    """Path A: DSL-compiled GDSSpec (shared predator_prey_model)."""
+    return predator_prey_spec
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def hand_spec():
     """Path B: Hand-built GDSSpec using raw GDS primitives.
 
@@ -111,108 +144,23 @@ def hand_spec():
         )
     )
 
-    # 4. Blocks — auxiliaries (Policy)
-    spec.register_block(
-        Policy(
-            name="Prey Growth",
-            interface=Interface(
-                forward_in=(port("Prey Level"),),
-                forward_out=(port("Prey Growth Signal"),),
-            ),
-        )
-    )
-    spec.register_block(
-        Policy(
-            name="Predation",
-            interface=Interface(
-                forward_in=(port("Prey Level"), port("Predator Level")),
-                forward_out=(port("Predation Signal"),),
-            ),
-        )
-    )
-    spec.register_block(
-        Policy(
-            name="Predator Growth",
-            interface=Interface(
-                forward_in=(port("Predator Level"), port("Prey Level")),
-                forward_out=(port("Predator Growth Signal"),),
-            ),
-        )
-    )
-    spec.register_block(
-        Policy(
-            name="Predator Decline",
-            interface=Interface(
-                forward_in=(port("Predator Level"),),
-                forward_out=(port("Predator Decline Signal"),),
-            ),
-        )
-    )
-
-    # 4b. Blocks — flows (Policy, no forward_in)
-    spec.register_block(
-        Policy(
-            name="Prey Births",
-            interface=Interface(
-                forward_out=(port("Prey Births Rate"),),
-            ),
+    # 4. Blocks — auxiliaries, flows (Policy) and stock mechanisms
+    for name, role, fin, fout, updates in _HAND_BLOCKS:
+        interface = Interface(
+            forward_in=tuple(port(p) for p in fin),
+            forward_out=tuple(port(p) for p in fout),
         )
-    )
-    spec.register_block(
-        Policy(
-            name="Prey Deaths",
-            interface=Interface(
-                forward_out=(port("Prey Deaths Rate"),),
-            ),
-        )
-    )
-    spec.register_block(
-        Policy(
-            name="Predator Births",
-            interface=Interface(
-                forward_out=(port("Predator Births Rate"),),
-            ),
-        )
-    )
-    spec.register_block(
-        Policy(
-            name="Predator Deaths",
-            interface=Interface(
-                forward_out=(port("Predator Deaths Rate"),),
-            ),
-        )
-    )
-
-    # 4c. Blocks — stock mechanisms
-    spec.register_block(
-        Mechanism(
-            name="Prey Accumulation",
-            interface=Interface(
-                forward_in=(port("Prey Births Rate"), port("Prey Deaths Rate")),
-                forward_out=(port("Prey Level"),),
-            ),
-            updates=[("Prey", "level")],
-        )
-    )
-    spec.register_block(
-        Mechanism(
-            name="Predator Accumulation",
-            interface=Interface(
-                forward_in=(
-                    port("Predator Births Rate"),
-                    port("Predator Deaths Rate"),
-                ),
-                forward_out=(port("Predator Level"),),
-            ),
-            updates=[("Predator", "level")],
-        )
-    )
+        if updates:
+            block = role(name=name, interface=interface, updates=list(updates))
+        else:
+            block = role(name=name, interface=interface)
+        spec.register_block(block)
 
     # 5. Wirings
     spec.register_wiring(
         SpecWiring(
             name="Predator Prey Wiring",
-            block_names=[b for b in spec.blocks],
+            block_names=list(spec.blocks),
             wires=[
                 Wire(
                     source="Prey Births",
@@ -244,13 +192,27 @@ def hand_spec():
     return spec
 
 
-@pytest.fixture
-def dsl_ir(predator_prey_model):
-    """Path A: DSL-compiled SystemIR."""
-    return compile_to_system(predator_prey_model)
+@pytest.fixture(scope="module")
+def dsl_ir(predator_prey_ir):
+    """Path A: DSL-compiled SystemIR (shared predator_prey_model)."""
+    return predator_prey_ir
+
 
+# (source_block, source_port, target_block, target_port) for each temporal
+# wiring: stock levels feed back to the auxiliaries that read them at t+1.
+_HAND_TEMPORAL = (
+    # Prey Level → Prey Growth, Predation, Predator Growth
+    ("Prey Accumulation", "Prey Level", "Prey Growth", "Prey Level"),
+    ("Prey Accumulation", "Prey Level", "Predation", "Prey Level"),
+    ("Prey Accumulation", "Prey Level", "Predator Growth", "Prey Level"),
+    # Predator Level → Predation, Predator Growth, Predator Decline
+    ("Predator Accumulation", "Predator Level", "Predation", "Predator Level"),
+    ("Predator Accumulation", "Predator Level", "Predator Growth", "Predator Level"),
+    ("Predator Accumulation", "Predator Level", "Predator Decline", "Predator Level"),
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def hand_ir(hand_spec):
     """Path B: Hand-built composition tree → SystemIR.
 
@@ -259,26 +221,21 @@ def hand_ir(hand_spec):
     """
     blocks = hand_spec.blocks
 
+    # Each tier is a left fold of ``|`` — the same binary tree the compiler's
+    # _parallel_tier builds, so composition names line up. There is no n-ary
+    # ParallelComposition to build a tier in one call.
+
     # Tier 1: auxiliaries in parallel
-    aux_names = ["Prey Growth", "Predation", "Predator Growth", "Predator Decline"]
-    aux_blocks = [blocks[n] for n in aux_names]
-    aux_tier = aux_blocks[0]
-    for b in aux_blocks[1:]:
-        aux_tier = aux_tier | b
+    aux_blocks = [blocks[n] for n in _AUX_NAMES]
+    aux_tier = functools.reduce(operator.or_, aux_blocks)
 
     # Tier 2: flows in parallel
-    flow_names = ["Prey Births", "Prey Deaths", "Predator Births", "Predator Deaths"]
-    flow_blocks = [blocks[n] for n in flow_names]
-    flow_tier = flow_blocks[0]
-    for b in flow_blocks[1:]:
-        flow_tier = flow_tier | b
+    flow_blocks = [blocks[n] for n in _FLOW_NAMES]
+    flow_tier = functools.reduce(operator.or_, flow_blocks)
 
     # Tier 3: mechanisms in parallel
-    mech_names = ["Prey Accumulation", "Predator Accumulation"]
-    mech_blocks = [blocks[n] for n in mech_names]
-    mech_tier = mech_blocks[0]
-    for b in mech_blocks[1:]:
-        mech_tier = mech_tier | b
+    mech_blocks = [blocks[n] for n in _MECHANISM_NAMES]
+    mech_tier = functools.reduce(operator.or_, mech_blocks)
 
     # Sequential: aux >> flow (no wirings — flows have no forward_in)
     root = aux_tier >> flow_tier
@@ -308,50 +265,14 @@ def hand_ir(hand_spec):
 
     # Temporal loop: stock levels → auxiliaries at t+1
     temporal_wirings = [
-        # Prey Level → Prey Growth, Predation, Predator Growth
-        Wiring(
-            source_block="Prey Accumulation",
-            source_port="Prey Level",
-            target_block="Prey Growth",
-            target_port="Prey Level",
-            direction=FlowDirection.COVARIANT,
-        ),
-        Wiring(
-            source_block="Prey Accumulation",
-            source_port="Prey Level",
-            target_block="Predation",
-            target_port="Prey Level",
-            direction=FlowDirection.COVARIANT,
-        ),
-        Wiring(
-            source_block="Prey Accumulation",
-            source_port="Prey Level",
-            target_block="Predator Growth",
-            target_port="Prey Level",
-            direction=FlowDirection.COVARIANT,
-        ),
-        # Predator Level → Predation, Predator Growth, Predator Decline
         Wiring(
-            source_block="Predator Accumulation",
-            source_port="Predator Level",
-            target_block="Predation",
-            target_port="Predator Level",
+            source_block=src_block,
+            source_port=src_port,
+            target_block=tgt_block,
+            target_port=tgt_port,
             direction=FlowDirection.COVARIANT,
-        ),
-        Wiring(
-            source_block="Predator Accumulation",
-            source_port="Predator Level",
-            target_block="Predator Growth",
-            target_port="Predator Level",
-            direction=FlowDirection.COVARIANT,
-        ),
-        Wiring(
-            source_block="Predator Accumulation",
-            source_port="Predator Level",
-            target_block="Predator Decline",
-            target_port="Predator Level",
-            direction=FlowDirection.COVARIANT,
-        ),
+        )
+        for src_block, src_port, tgt_block, tgt_port in _HAND_TEMPORAL
     ]
 
     root = root.loop(temporal_wirings)
@@ -361,50 +282,69 @@ def hand_ir(hand_spec):
 # ── Level 1: GDSSpec equivalence ────────────────────────────────
 
 
+def _port_name_sets(block) -> tuple[frozenset[str], frozenset[str]]:
+    return (
+        frozenset(p.name for p in block.interface.forward_in),
+        frozenset(p.name for p in block.interface.forward_out),
+    )
+
+
+@pytest.fixture(scope="module")
+def port_names(dsl_spec, hand_spec):
+    """Block name → (DSL (in, out), hand-built (in, out)) port-name sets."""
+    return {
+        name: (
+            _port_name_sets(dsl_spec.blocks[name]),
+            _port_name_sets(hand_spec.blocks[name]),
+        )
+        for name in dsl_spec.blocks
+    }
+
+
 class TestSpecEquivalence:
     """GDSSpec-level structural equivalence between DSL and hand-built."""
 
     def test_entity_names_match(self, dsl_spec, hand_spec):
-        assert set(dsl_spec.entities.keys()) == set(hand_spec.entities.keys())
+        assert dsl_spec.entities.keys() == hand_spec.entities.keys()
 
     def test_entity_variables_match(self, dsl_spec, hand_spec):
         for name in dsl_spec.entities:
-            dsl_vars = set(dsl_spec.entities[name].variables.keys())
-            hand_vars = set(hand_spec.entities[name].variables.keys())
+            dsl_vars = dsl_spec.entities[name].variables.keys()
+            hand_vars = hand_spec.entities[name].variables.keys()
             assert dsl_vars == hand_vars, f"Entity {name!r} variable mismatch"
 
     def test_block_names_match(self, dsl_spec, hand_spec):
-        assert set(dsl_spec.blocks.keys()) == set(hand_spec.blocks.keys())
-
-    def test_block_role_types_match(self, dsl_spec, hand_spec):
-        for name in dsl_spec.blocks:
-            dsl_block = dsl_spec.blocks[name]
-            hand_block = hand_spec.blocks[name]
-            assert isinstance(hand_block, type(dsl_block)), (
-                f"Block {name!r}: DSL is {type(dsl_block).__name__}, "
-                f"hand-built is {type(hand_block).__name__}"
-            )
-
-    def test_block_forward_in_ports_match(self, dsl_spec, hand_spec):
-        for name in dsl_spec.blocks:
-            dsl_ports = {p.name for p in dsl_spec.blocks[name].interface.forward_in}
-            hand_ports = {p.name for p in hand_spec.blocks[name].interface.forward_in}
-            assert dsl_ports == hand_ports, f"Block {name!r} forward_in mismatch"
-
-    def test_block_forward_out_ports_match(self, dsl_spec, hand_spec):
-        for name in dsl_spec.blocks:
-            dsl_ports = {p.name for p in dsl_spec.blocks[name].interface.forward_out}
-            hand_ports = {p.name for p in hand_spec.blocks[name].interface.forward_out}
-            assert dsl_ports == hand_ports, f"Block {name!r} forward_out mismatch"
-
-    def test_mechanism_updates_match(self, dsl_spec, hand_spec):
-        for name in dsl_spec.blocks:
-            dsl_block = dsl_spec.blocks[name]
-            hand_block = hand_spec.blocks[name]
-            if isinstance(dsl_block, Mechanism):
-                assert set(map(tuple, dsl_block.updates)) == set(
-                    map(tuple, hand_block.updates)
-                ), f"Mechanism {name!r} update targets mismatch"
+        assert dsl_spec.blocks.keys() == hand_spec.blocks.keys()
+        # The per-block tests below are parametrized over _BLOCK_NAMES.
+        assert dsl_spec.blocks.keys() == set(_BLOCK_NAMES)
+
+    @pytest.mark.parametrize("name", _BLOCK_NAMES)
+    def test_block_role_types_match(self, dsl_spec, hand_spec, name):
+        dsl_block = dsl_spec.blocks[name]
+        hand_block = hand_spec.blocks[name]
+        assert isinstance(hand_block, type(dsl_block)), (
+            f"Block {name!r}: DSL is {type(dsl_block).__name__}, "
+            f"hand-built is {type(hand_block).__name__}"
+        )
+
+    @pytest.mark.parametrize("name", _BLOCK_NAMES)
+    def test_block_forward_in_ports_match(self, port_names, name):
+        (dsl_in, _), (hand_in, _) = port_names[name]
+        assert dsl_in == hand_in, f"Block {name!r} forward_in mismatch"
+
+    @pytest.mark.parametrize("name", _BLOCK_NAMES)
+    def test_block_forward_out_ports_match(self, port_names, name):
+        (_, dsl_out), (_, hand_out) = port_names[name]
+        assert dsl_out == hand_out, f"Block {name!r} forward_out mismatch"
+
+    @pytest.mark.parametrize("name", _MECHANISM_NAMES)
+    def test_mechanism_updates_match(self, dsl_spec, hand_spec, name):
+        dsl_block = dsl_spec.blocks[name]
+        hand_block = hand_spec.blocks[name]
+        assert isinstance(dsl_block, Mechanism)
+        assert set(map(tuple, dsl_block.updates)) == set(
+            map(tuple, hand_block.updates)
+        ), f"Mechanism {name!r} update targets mismatch"
 
     def test_parameter_schema_match(self, dsl_spec, hand_spec):
         assert dsl_spec.parameter_schema.names() == hand_spec.parameter_schema.names()
@@ -420,16 +360,20 @@ class TestSpecEquivalence:
 class TestCanonicalEquivalence:
     """CanonicalGDS-level equivalence between DSL and hand-built."""
 
-    @pytest.fixture
-    def dsl_canonical(self, dsl_spec):
-        return project_canonical(dsl_spec)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def dsl_canonical(cls, predator_prey_canonical):
+        return predator_prey_canonical
 
-    @pytest.fixture
-    def hand_canonical(self, hand_spec):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def hand_canonical(cls, hand_spec):
         return project_canonical(hand_spec)
 
     def test_state_variables_match(self, dsl_canonical, hand_canonical):
-        assert set(dsl_canonical.state_variables) == set(hand_canonical.state_variables)
+        # Both specs register entities in the same order, so the projected
+        # tuples must agree element-for-element.
+        assert dsl_canonical.state_variables == hand_canonical.state_variables
 
     def test_boundary_blocks_match(self, dsl_canonical, hand_canonical):
         assert set(dsl_canonical.boundary_blocks) == set(hand_canonical.boundary_blocks)
@@ -454,26 +398,49 @@ class TestCanonicalEquivalence:
 # ── Level 3: SystemIR equivalence ──────────────────────────────
 
 
+class _IRIndex(NamedTuple):
+    """Everything the SystemIR comparisons read, gathered in one pass."""
+
+    block_names: frozenset[str]
+    n_blocks: int
+    n_wirings: int
+    # (source, target) of every temporal wiring, duplicates kept
+    temporal_pairs: tuple[tuple[str, str], ...]
+
+
+def _index_ir(ir) -> _IRIndex:
+    return _IRIndex(
+        block_names=frozenset(b.name for b in ir.blocks),
+        n_blocks=len(ir.blocks),
+        n_wirings=len(ir.wirings),
+        temporal_pairs=tuple((w.source, w.target) for w in ir.wirings if w.is_temporal),
+    )
+
+
 class TestSystemIREquivalence:
     """SystemIR-level equivalence between DSL and hand-built."""
 
-    def test_block_count_match(self, dsl_ir, hand_ir):
-        assert len(dsl_ir.blocks) == len(hand_ir.blocks)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def dsl_index(cls, dsl_ir):
+        return _index_ir(dsl_ir)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def hand_index(cls, hand_ir):
+        return _index_ir(hand_ir)
+
+    def test_block_count_match(self, dsl_index, hand_index):
+        assert dsl_index.n_blocks == hand_index.n_blocks
 
-    def test_block_names_match(self, dsl_ir, hand_ir):
-        dsl_names = {b.name for b in dsl_ir.blocks}
-        hand_names = {b.name for b in hand_ir.blocks}
-        assert dsl_names == hand_names
+    def test_block_names_match(self, dsl_index, hand_index):
+        assert dsl_index.block_names == hand_index.block_names
 
-    def test_wiring_count_match(self, dsl_ir, hand_ir):
-        assert len(dsl_ir.wirings) == len(hand_ir.wirings)
+    def test_wiring_count_match(self, dsl_index, hand_index):
+        assert dsl_index.n_wirings == hand_index.n_wirings
 
-    def test_temporal_wiring_count_match(self, dsl_ir, hand_ir):
-        dsl_temporal = [w for w in dsl_ir.wirings if w.is_temporal]
-        hand_temporal = [w for w in hand_ir.wirings if w.is_temporal]
-        assert len(dsl_temporal) == len(hand_temporal)
+    def test_temporal_wiring_count_match(self, dsl_index, hand_index):
+        assert len(dsl_index.temporal_pairs) == len(hand_index.temporal_pairs)
 
-    def test_temporal_wiring_pairs_match(self, dsl_ir, hand_ir):
-        dsl_pairs = {(w.source, w.target) for w in dsl_ir.wirings if w.is_temporal}
-        hand_pairs = {(w.source, w.target) for w in hand_ir.wirings if w.is_temporal}
-        assert dsl_pairs == hand_pairs
+    def test_temporal_wiring_pairs_match(self, dsl_index, hand_index):
+        assert set(dsl_index.temporal_pairs) == set(hand_index.temporal_pairs)
@@ -2,68 +2,61 @@
 
 import pytest
 
-from gds.canonical import project_canonical
+from gds.verification.findings import Finding
 from gds_domains.stockflow.dsl.compile import compile_model, compile_to_system
-from gds_domains.stockflow.dsl.elements import Auxiliary, Converter, Flow, Stock
+from gds_domains.stockflow.dsl.elements import Stock
 from gds_domains.stockflow.dsl.model import StockFlowModel
 from gds_domains.stockflow.verification.engine import verify
 
 
+def _is_error(finding: Finding) -> bool:
+    return not finding.passed and finding.severity == "error"
+
+
 class TestPopulationEndToEnd:
     """Population dynamics: Births/Deaths with Birth Rate auxiliary."""
 
-    @pytest.fixture
-    def model(self):
-        return StockFlowModel(
-            name="Population Dynamics",
-            stocks=[Stock(name="Population", initial=1000.0)],
-            flows=[
-                Flow(name="Births", target="Population"),
-                Flow(name="Deaths", source="Population"),
-            ],
-            auxiliaries=[
-                Auxiliary(name="Birth Rate", inputs=["Population", "Fertility"]),
-                Auxiliary(name="Death Rate", inputs=["Population"]),
-            ],
-            converters=[Converter(name="Fertility")],
-            description="Simple population dynamics model",
-        )
-
-    def test_compile_to_spec(self, model):
-        spec = compile_model(model)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sf_report(cls, population_dynamics_model):
+        return verify(population_dynamics_model, include_gds_checks=False)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def full_report(cls, population_dynamics_model):
+        return verify(population_dynamics_model, include_gds_checks=True)
+
+    def test_compile_to_spec(self, population_dynamics_model):
+        spec = compile_model(population_dynamics_model)
         assert spec.name == "Population Dynamics"
         assert len(spec.types) == 4  # Level, UnconstrainedLevel, Rate, Signal
         assert len(spec.spaces) == 4
         assert len(spec.entities) == 1  # Population
         assert len(spec.blocks) == 6  # 1 conv + 2 aux + 2 flow + 1 mech
 
-    def test_compile_to_system_ir(self, model):
-        ir = compile_to_system(model)
+    def test_compile_to_system_ir(self, population_dynamics_model):
+        ir = compile_to_system(population_dynamics_model)
         assert ir.name == "Population Dynamics"
         assert len(ir.blocks) == 6
         temporal = [w for w in ir.wirings if w.is_temporal]
         # Population → Birth Rate, Population → Death Rate (aux only, not flows)
         assert len(temporal) == 2
 
-    def test_verify_sf_no_errors(self, model):
+    def test_verify_sf_no_errors(self, sf_report):
         """All SF checks pass (no domain errors)."""
-        report = verify(model, include_gds_checks=False)
-        errors = [f for f in report.findings if not f.passed and f.severity == "error"]
-        assert len(errors) == 0
+        assert not any(_is_error(f) for f in sf_report.findings), [
+            f.check_id for f in sf_report.findings if _is_error(f)
+        ]
 
-    def test_verify_with_gds_runs(self, model):
+    def test_verify_with_gds_runs(self, full_report):
         """GDS checks run without exceptions. Some G-002 findings are expected
         for BoundaryActions/Flows which have no forward_in by design."""
-        report = verify(model, include_gds_checks=True)
-        assert report.checks_total > 0
-        sf_findings = [f for f in report.findings if f.check_id.startswith("SF-")]
-        gds_findings = [f for f in report.findings if f.check_id.startswith("G-")]
-        assert len(sf_findings) > 0
-        assert len(gds_findings) > 0
-
-    def test_canonical_projection(self, model):
-        spec = compile_model(model)
-        canonical = project_canonical(spec)
+        assert full_report.checks_total > 0
+        families = {f.check_id.partition("-")[0] for f in full_report.findings}
+        assert {"SF", "G"} <= families
+
+    def test_canonical_projection(self, compiled_models):
+        _, canonical = compiled_models["population_dynamics"]
         # State space: Population entity with level variable
         assert len(canonical.state_variables) == 1
         assert canonical.state_variables[0] == ("Population", "level")
@@ -75,13 +68,13 @@ class TestPopulationEndToEnd:
         # Mechanisms: 1 stock accumulator
         assert len(canonical.mechanism_blocks) == 1
 
-    def test_spec_validates(self, model):
-        spec = compile_model(model)
+    def test_spec_validates(self, compiled_models):
+        spec, _ = compiled_models["population_dynamics"]
         errors = spec.validate_spec()
         assert len(errors) == 0, f"Spec validation errors: {errors}"
 
-    def test_transition_signatures_emitted(self, model):
-        spec = compile_model(model)
+    def test_transition_signatures_emitted(self, compiled_models):
+        spec, _ = compiled_models["population_dynamics"]
         assert len(spec.transition_signatures) == 1
         ts = spec.transition_signatures["Population Accumulation"]
         assert ("Population", "level") in ts.reads
@@ -92,42 +85,25 @@ class TestPopulationEndToEnd:
 class TestPredatorPreyEndToEnd:
     """Two-stock predator-prey model."""
 
-    @pytest.fixture
-    def model(self):
-        return StockFlowModel(
-            name="Predator Prey",
-            stocks=[
-                Stock(name="Prey", initial=100.0),
-                Stock(name="Predator", initial=20.0),
-            ],
-            flows=[
-                Flow(name="Prey Births", target="Prey"),
-                Flow(name="Prey Deaths", source="Prey"),
-                Flow(name="Predator Births", target="Predator"),
-                Flow(name="Predator Deaths", source="Predator"),
-            ],
-            auxiliaries=[
-                Auxiliary(name="Prey Growth", inputs=["Prey"]),
-                Auxiliary(name="Predation", inputs=["Prey", "Predator"]),
-                Auxiliary(name="Predator Growth", inputs=["Predator", "Prey"]),
-                Auxiliary(name="Predator Decline", inputs=["Predator"]),
-            ],
-        )
-
-    def test_compile_two_stocks(self, model):
-        spec = compile_model(model)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sf_report(cls, predator_prey_model):
+        return verify(predator_prey_model, include_gds_checks=False)
+
+    def test_compile_two_stocks(self, predator_prey_model):
+        spec = compile_model(predator_prey_model)
         assert "Prey" in spec.entities
         assert "Predator" in spec.entities
         assert len(spec.blocks) == 10  # 4 aux + 4 flow + 2 mech
 
-    def test_system_ir_two_stocks(self, model):
-        ir = compile_to_system(model)
+    def test_system_ir_two_stocks(self, predator_prey_model):
+        ir = compile_to_system(predator_prey_model)
         assert len(ir.blocks) == 10
 
-    def test_verify_sf_no_errors(self, model):
-        report = verify(model, include_gds_checks=False)
-        errors = [f for f in report.findings if not f.passed and f.severity == "error"]
-        assert len(errors) == 0
+    def test_verify_sf_no_errors(self, sf_report):
+        assert not any(_is_error(f) for f in sf_report.findings), [
+            f.check_id for f in sf_report.findings if _is_error(f)
+        ]
 
 
 class TestMinimalModel:
@@ -146,52 +122,30 @@ class TestMinimalModel:
 class TestSIRModel:
     """Classic SIR epidemiology model — 3 stocks, 2 flows, 2 auxiliaries."""
 
-    @pytest.fixture
-    def model(self):
-        return StockFlowModel(
-            name="SIR",
-            stocks=[
-                Stock(name="Susceptible", initial=999.0),
-                Stock(name="Infected", initial=1.0),
-                Stock(name="Recovered", initial=0.0),
-            ],
-            flows=[
-                Flow(name="Infection", source="Susceptible", target="Infected"),
-                Flow(name="Recovery", source="Infected", target="Recovered"),
-            ],
-            auxiliaries=[
-                Auxiliary(
-                    name="Infection Rate",
-                    inputs=["Susceptible", "Infected", "Contact Rate"],
-                ),
-                Auxiliary(name="Recovery Rate", inputs=["Infected", "Recovery Time"]),
-            ],
-            converters=[
-                Converter(name="Contact Rate"),
-                Converter(name="Recovery Time"),
-            ],
-        )
-
-    def test_three_stocks(self, model):
-        spec = compile_model(model)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sf_report(cls, sir_model):
+        return verify(sir_model, include_gds_checks=False)
+
+    def test_three_stocks(self, sir_model):
+        spec = compile_model(sir_model)
         assert len(spec.entities) == 3
         assert len(spec.blocks) == 9  # 2 conv + 2 aux + 2 flow + 3 mech
 
-    def test_verify_sf_no_errors(self, model):
-        report = verify(model, include_gds_checks=False)
-        errors = [f for f in report.findings if not f.passed and f.severity == "error"]
-        assert len(errors) == 0
+    def test_verify_sf_no_errors(self, sf_report):
+        assert not any(_is_error(f) for f in sf_report.findings), [
+            f.check_id for f in sf_report.findings if _is_error(f)
+        ]
 
-    def test_canonical(self, model):
-        spec = compile_model(model)
-        canonical = project_canonical(spec)
+    def test_canonical(self, compiled_models):
+        _, canonical = compiled_models["sir"]
         assert len(canonical.state_variables) == 3  # S, I, R levels
         assert len(canonical.mechanism_blocks) == 3
         assert len(canonical.boundary_blocks) == 2  # Contact Rate, Recovery Time
 
-    def test_conservation_structure(self, model):
+    def test_conservation_structure(self, sir_model):
         """Infection and Recovery are inter-stock flows (source AND target)."""
-        ir = compile_to_system(model)
+        ir = compile_to_system(sir_model)
         block_names = {b.name for b in ir.blocks}
         assert "Susceptible Accumulation" in block_names
         assert "Infected Accumulation" in block_names
@@ -1,5 +1,7 @@
 """Tests for StockFlowModel validation."""
 
+import re
+
 import pytest
 
 from gds_domains.stockflow.dsl.elements import Auxiliary, Converter, Flow, Stock
@@ -29,50 +31,56 @@ class TestModelConstruction:
         assert len(m.element_names) == 5
 
 
-class TestValidation:
-    def test_no_stocks_raises(self):
-        with pytest.raises(SFValidationError, match="at least one stock"):
-            StockFlowModel(name="Bad", stocks=[])
-
-    def test_duplicate_names_raises(self):
-        with pytest.raises(SFValidationError, match="Duplicate element name"):
-            StockFlowModel(
-                name="Bad",
-                stocks=[Stock(name="X")],
-                flows=[Flow(name="X", target="X")],
-            )
-
-    def test_flow_bad_source_raises(self):
-        with pytest.raises(SFValidationError, match="not a declared stock"):
-            StockFlowModel(
-                name="Bad",
-                stocks=[Stock(name="A")],
-                flows=[Flow(name="F", source="Nonexistent", target="A")],
-            )
-
-    def test_flow_bad_target_raises(self):
-        with pytest.raises(SFValidationError, match="not a declared stock"):
-            StockFlowModel(
-                name="Bad",
-                stocks=[Stock(name="A")],
-                flows=[Flow(name="F", source="A", target="Nonexistent")],
-            )
+# Compiled once at import and handed to pytest.raises(match=...) directly.
+_NOT_A_STOCK = re.compile("not a declared stock")
 
-    def test_flow_no_source_or_target_raises(self):
-        with pytest.raises(SFValidationError, match="at least one of source or target"):
-            StockFlowModel(
-                name="Bad",
-                stocks=[Stock(name="A")],
-                flows=[Flow(name="F")],
-            )
 
-    def test_auxiliary_bad_input_raises(self):
-        with pytest.raises(SFValidationError, match="not a declared element"):
-            StockFlowModel(
-                name="Bad",
-                stocks=[Stock(name="A")],
-                auxiliaries=[Auxiliary(name="Aux", inputs=["Nonexistent"])],
-            )
+class TestValidation:
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            pytest.param(
+                {"stocks": []}, re.compile("at least one stock"), id="no_stocks"
+            ),
+            pytest.param(
+                {"stocks": [Stock(name="X")], "flows": [Flow(name="X", target="X")]},
+                re.compile("Duplicate element name"),
+                id="duplicate_names",
+            ),
+            pytest.param(
+                {
+                    "stocks": [Stock(name="A")],
+                    "flows": [Flow(name="F", source="Nonexistent", target="A")],
+                },
+                _NOT_A_STOCK,
+                id="flow_bad_source",
+            ),
+            pytest.param(
+                {
+                    "stocks": [Stock(name="A")],
+                    "flows": [Flow(name="F", source="A", target="Nonexistent")],
+                },
+                _NOT_A_STOCK,
+                id="flow_bad_target",
+            ),
+            pytest.param(
+                {"stocks": [Stock(name="A")], "flows": [Flow(name="F")]},
+                re.compile("at least one of source or target"),
+                id="flow_no_source_or_target",
+            ),
+            pytest.param(
+                {
+                    "stocks": [Stock(name="A")],
+                    "auxiliaries": [Auxiliary(name="Aux", inputs=["Nonexistent"])],
+                },
+                re.compile("not a declared element"),
+                id="auxiliary_bad_input",
+            ),
+        ],
+    )
+    def test_invalid_model_raises(self, kwargs, match):
+        with pytest.raises(SFValidationError, match=match):
+            StockFlowModel(name="Bad", **kwargs)
 
     def test_auxiliary_references_valid_elements(self):
         m = StockFlowModel(
@@ -1,7 +1,10 @@
 """Tests for stock-flow verification checks."""
 
+from collections import defaultdict
+
 import pytest
 
+from gds.verification.findings import Finding
 from gds_domains.stockflow.dsl.elements import Auxiliary, Converter, Flow, Stock
 from gds_domains.stockflow.dsl.model import StockFlowModel
 from gds_domains.stockflow.verification.checks import (
@@ -14,6 +17,14 @@ from gds_domains.stockflow.verification.checks import (
 from gds_domains.stockflow.verification.engine import verify
 
 
+def _by_family(findings: list[Finding]) -> dict[str, list[Finding]]:
+    """Group findings by check-ID family ("SF", "G") in a single pass."""
+    groups: dict[str, list[Finding]] = defaultdict(list)
+    for f in findings:
+        groups[f.check_id.partition("-")[0]].append(f)
+    return groups
+
+
 @pytest.fixture
 def good_model():
     return StockFlowModel(
@@ -120,15 +131,13 @@ class TestVerifyEngine:
         assert report.system_name == "Population"
         assert report.checks_total > 0
         # SF checks + GDS checks
-        sf_findings = [f for f in report.findings if f.check_id.startswith("SF-")]
-        gds_findings = [f for f in report.findings if f.check_id.startswith("G-")]
-        assert len(sf_findings) > 0
-        assert len(gds_findings) > 0
+        by_family = _by_family(report.findings)
+        assert len(by_family["SF"]) > 0
+        assert len(by_family["G"]) > 0
 
     def test_verify_sf_only(self, good_model):
         report = verify(good_model, include_gds_checks=False)
-        gds_findings = [f for f in report.findings if f.check_id.startswith("G-")]
-        assert len(gds_findings) == 0
+        assert "G" not in _by_family(report.findings)
 
     def test_verify_specific_checks(self, good_model):
         report = verify(
@@ -6,7 +6,7 @@ and ad-hoc traversal methods with a clean query API.
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import TYPE_CHECKING
 
 from gds.blocks.roles import HasParams, Mechanism
@@ -54,6 +54,19 @@ class SpecQuery:
                         result[ename][vname].append(bname)
         return result
 
+    def mechanism_update_map(self) -> dict[str, list[tuple[str, str]]]:
+        """Map mechanism -> state variables it updates.
+
+        The inverse of ``entity_update_map``: only updates that name a
+        registered entity variable are included.
+        """
+        result: dict[str, list[tuple[str, str]]] = {}
+        for ename, var_map in self.entity_update_map().items():
+            for vname, mechs in var_map.items():
+                for mname in mechs:
+                    result.setdefault(mname, []).append((ename, vname))
+        return result
+
     def dependency_graph(self) -> dict[str, set[str]]:
         """Full block dependency DAG (who feeds whom) from all wirings."""
         adj: dict[str, set[str]] = defaultdict(set)
@@ -90,18 +103,22 @@ class SpecQuery:
             if isinstance(block, Mechanism) and (entity, variable) in block.updates:
                 direct.append(bname)
 
-        adj: dict[str, set[str]] = defaultdict(set)
-        for wiring in self.spec.wirings.values():
-            for wire in wiring.wires:
-                adj[wire.source].add(wire.target)
+        # Walk the dependency graph backwards from the direct mechanisms, so
+        # every upstream block is found in one traversal.
+        reverse: dict[str, set[str]] = defaultdict(set)
+        for source, targets in self.dependency_graph().items():
+            for target in targets:
+                reverse[target].add(source)
 
-        all_affecting: set[str] = set(direct)
-        for mech_name in direct:
-            for bname in self.spec.blocks:
-                if self._can_reach(adj, bname, mech_name):
-                    all_affecting.add(bname)
+        reached: set[str] = set(direct)
+        frontier = deque(direct)
+        while frontier:
+            for source in reverse.get(frontier.popleft(), ()):
+                if source not in reached:
+                    reached.add(source)
+                    frontier.append(source)
 
-        return sorted(all_affecting)
+        return sorted(reached & self.spec.blocks.keys())
 
     def admissibility_dependency_map(self) -> dict[str, list[tuple[str, str]]]:
         """Map boundary block -> state variables constraining its inputs."""
@@ -125,20 +142,3 @@ class SpecQuery:
             for mname, ts in self.spec.transition_signatures.items()
             if ref in ts.reads
         ]
-
-    @staticmethod
-    def _can_reach(adj: dict[str, set[str]], source: str, target: str) -> bool:
-        """BFS reachability check."""
-        if source == target:
-            return False
-        visited: set[str] = set()
-        queue = [source]
-        while queue:
-            current = queue.pop(0)
-            if current == target:
-                return True
-            if current in visited:
-                continue
-            visited.add(current)
-            queue.extend(adj.get(current, set()))
-        return False
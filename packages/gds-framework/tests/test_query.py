@@ -129,6 +129,20 @@ class TestEntityUpdateMap:
         assert "Update Prey" not in update_map["Predator"]["population"]
 
 
+class TestMechanismUpdateMap:
+    def test_inverts_entity_update_map(self, query_spec):
+        q = SpecQuery(query_spec)
+        mech_map = q.mechanism_update_map()
+        assert mech_map["Update Prey"] == [("Prey", "population")]
+        assert mech_map["Update Predator"] == [("Predator", "population")]
+
+    def test_non_mechanisms_absent(self, query_spec):
+        q = SpecQuery(query_spec)
+        mech_map = q.mechanism_update_map()
+        assert "Observe" not in mech_map
+        assert "Hunt" not in mech_map
+
+
 # ── dependency_graph ─────────────────────────────────────────
 
 
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 
+# Spaces, hyphens and dots become underscores; parentheses are dropped.
+_SANITIZE_TABLE = str.maketrans({" ": "_", "-": "_", ".": "_", "(": None, ")": None})
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_id(name: str) -> str:
     """Convert a name to a valid Mermaid identifier.
 
@@ -10,18 +16,13 @@ def sanitize_id(name: str) -> str:
     Prefixes with underscore if result starts with a digit
     (Mermaid IDs cannot start with digits).
     """
-    result = (
-        name.replace(" ", "_")
-        .replace("-", "_")
-        .replace(".", "_")
-        .replace("(", "")
-        .replace(")", "")
-    )
+    result = name.translate(_SANITIZE_TABLE)
     if not result or result[0].isdigit():
         result = "_" + result
     return result
 
 
+@functools.lru_cache(maxsize=4096)
 def entity_id(ename: str) -> str:
     """Generate a unique Mermaid ID for an entity node.
 
@@ -31,6 +32,7 @@ def entity_id(ename: str) -> str:
     return f"entity_{sanitize_id(ename)}"
 
 
+@functools.lru_cache(maxsize=4096)
 def param_id(pname: str) -> str:
     """Generate a unique Mermaid ID for a parameter node."""
     return f"param_{sanitize_id(pname)}"
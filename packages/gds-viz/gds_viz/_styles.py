@@ -7,7 +7,12 @@ with the theme's canvas, edge, and subgraph defaults.
 
 from __future__ import annotations
 
-from typing import Literal
+import functools
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal, get_args
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 # --- Theme support ---
 MermaidTheme = Literal["default", "neutral", "dark", "forest", "base"]
@@ -18,6 +23,15 @@ DEFAULT_THEME: MermaidTheme = "neutral"
 THEME_DIRECTIVE = f'%%{{init:{{"theme":"{DEFAULT_THEME}"}}}}%%'
 
 
+def _format_directive(theme: str) -> str:
+    return f'%%{{init:{{"theme":"{theme}"}}}}%%'
+
+
+_THEME_DIRECTIVES: dict[str, str] = {
+    t: _format_directive(t) for t in get_args(MermaidTheme)
+}
+
+
 def theme_directive(theme: MermaidTheme | None = None) -> str:
     """Return the Mermaid init directive for the given theme.
 
@@ -25,7 +39,7 @@ def theme_directive(theme: MermaidTheme | None = None) -> str:
         theme: Mermaid theme name. None uses the default ('neutral').
     """
     t = theme or DEFAULT_THEME
-    return f'%%{{init:{{"theme":"{t}"}}}}%%'
+    return _THEME_DIRECTIVES.get(t) or _format_directive(t)
 
 
 # ---------------------------------------------------------------------------
@@ -40,7 +54,7 @@ def theme_directive(theme: MermaidTheme | None = None) -> str:
 #   empty      — placeholder / no-data style
 #   subgraphs  — subgraph background styles keyed by role
 
-_PALETTES: dict[MermaidTheme, dict] = {
+_PALETTE_TABLE: dict[MermaidTheme, dict] = {
     # ------------------------------------------------------------------
     # NEUTRAL — muted gray canvas, saturated classDef fills pop nicely
     # ------------------------------------------------------------------
@@ -158,6 +172,10 @@ _PALETTES: dict[MermaidTheme, dict] = {
     },
 }
 
+# Only the theme -> palette level is read-only; the nested dicts are shared
+# with the legacy constants below.
+_PALETTES: Mapping[MermaidTheme, dict] = MappingProxyType(_PALETTE_TABLE)
+
 
 def _palette(theme: MermaidTheme | None) -> dict:
     """Return the palette dict for a theme, falling back to default."""
@@ -183,25 +201,64 @@ CANONICAL_SUBGRAPH_IDS: dict[str, str] = {
 }
 
 
+# --- Precomputed classDef lines ---
+# Themes are a closed set, so every classDef line is formatted once at import
+# and the public helpers hand out copies. These are snapshots: mutating a
+# palette (or a legacy constant such as ROLE_STYLES) after import does not
+# change rendered output.
+
+_ROLE_CLASSDEFS: dict[MermaidTheme, tuple[str, ...]] = {
+    theme: tuple(f"    classDef {name} {style}" for name, style in p["roles"].items())
+    for theme, p in _PALETTES.items()
+}
+
+_ALL_CLASSDEFS: dict[MermaidTheme, tuple[str, ...]] = {
+    theme: (
+        *_ROLE_CLASSDEFS[theme],
+        f"    classDef entity {p['entity']}",
+        f"    classDef param {p['param']}",
+        f"    classDef state {p['state']}",
+        f"    classDef target {p['target']}",
+        f"    classDef empty {p['empty']}",
+    )
+    for theme, p in _PALETTES.items()
+}
+
+
 # --- Public helpers ---
 
 
 def classdefs_for_roles(theme: MermaidTheme | None = None) -> list[str]:
     """Return classDef lines for all role styles."""
-    p = _palette(theme)
-    return [f"    classDef {name} {style}" for name, style in p["roles"].items()]
+    return list(
+        _ROLE_CLASSDEFS.get(theme or DEFAULT_THEME, _ROLE_CLASSDEFS[DEFAULT_THEME])
+    )
 
 
 def classdefs_for_all(theme: MermaidTheme | None = None) -> list[str]:
     """Return classDef lines for roles + entity + param + state + target."""
-    p = _palette(theme)
-    lines = classdefs_for_roles(theme)
-    lines.append(f"    classDef entity {p['entity']}")
-    lines.append(f"    classDef param {p['param']}")
-    lines.append(f"    classDef state {p['state']}")
-    lines.append(f"    classDef target {p['target']}")
-    lines.append(f"    classDef empty {p['empty']}")
-    return lines
+    return list(
+        _ALL_CLASSDEFS.get(theme or DEFAULT_THEME, _ALL_CLASSDEFS[DEFAULT_THEME])
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def flowchart_prelude(
+    direction: str, theme: MermaidTheme | None = None, *, roles_only: bool = False
+) -> str:
+    """Return the newline-terminated header block for a flowchart.
+
+    Theme directive, ``flowchart <direction>`` line and classDef lines.
+    These depend only on the arguments, so each combination is built once.
+
+    Args:
+        direction: Flowchart direction (e.g. 'TD', 'LR').
+        theme: Mermaid theme name. None uses the default.
+        roles_only: Emit only the role classDefs instead of all of them.
+    """
+    classdefs = classdefs_for_roles(theme) if roles_only else classdefs_for_all(theme)
+    lines = (theme_directive(theme), f"flowchart {direction}", *classdefs)
+    return "\n".join(lines) + "\n"
 
 
 def subgraph_style_lines(
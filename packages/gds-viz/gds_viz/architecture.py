@@ -7,6 +7,8 @@ tag-based subgraphs from a GDSSpec.
 from __future__ import annotations
 
 from collections import defaultdict
+from itertools import chain
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from gds.query import SpecQuery
@@ -20,16 +22,22 @@ from gds_viz._styles import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from gds.spec import GDSSpec
 
 
-_ROLE_LABELS: dict[str, str] = {
-    "boundary": "Boundary (U)",
-    "policy": "Policy (g)",
-    "mechanism": "Mechanism (f)",
-    "control": "Control",
-    "generic": "Generic",
-}
+_ROLE_LABELS: Mapping[str, str] = MappingProxyType(
+    {
+        "boundary": "Boundary (U)",
+        "policy": "Policy (g)",
+        "mechanism": "Mechanism (f)",
+        "control": "Control",
+        "generic": "Generic",
+    }
+)
+# Subgraph order for role grouping.
+_ROLE_LABEL_ITEMS: tuple[tuple[str, str], ...] = tuple(_ROLE_LABELS.items())
 
 _ROLE_SHAPES: dict[str, tuple[str, str]] = {
     "boundary": ("([", "])"),
@@ -63,130 +71,147 @@ def spec_to_mermaid(
     Returns:
         Mermaid flowchart diagram as a string.
     """
-    lines = [theme_directive(theme), "flowchart TD"]
     query = SpecQuery(spec)
 
-    # Class definitions
-    lines.extend(classdefs_for_all(theme))
-
     # Render grouped blocks
     if group_by is not None:
-        sg_styles = _render_tag_groups(lines, spec, group_by)
+        groups, sg_styles = _render_tag_groups(spec, group_by)
     else:
-        sg_styles = _render_role_groups(lines, query, spec)
-
-    # Entity cylinders
-    if show_entities:
-        _render_entities(lines, spec, query)
-
-    # Dependency wires
-    if show_wires:
-        _render_wires(lines, spec, query)
-
-    # Subgraph background styling
-    lines.extend(subgraph_style_lines(sg_styles, theme))
-
-    return "\n".join(lines)
-
-
-def _render_role_groups(
-    lines: list[str], query: SpecQuery, spec: GDSSpec
-) -> dict[str, str]:
-    """Group blocks by GDS role into subgraphs. Returns sg_id -> role map."""
+        groups, sg_styles = _render_role_groups(query)
+
+    return "\n".join(
+        chain(
+            (theme_directive(theme), "flowchart TD"),
+            # Class definitions
+            classdefs_for_all(theme),
+            groups,
+            # Entity cylinders
+            _render_entities(spec, query) if show_entities else (),
+            # Dependency wires
+            _render_wires(spec, query) if show_wires else (),
+            # Subgraph background styling
+            subgraph_style_lines(sg_styles, theme),
+        )
+    )
+
+
+def _render_role_groups(query: SpecQuery) -> tuple[list[str], dict[str, str]]:
+    """Group blocks by GDS role into subgraphs.
+
+    Returns the subgraph lines and the sg_id -> role map.
+    """
     groups = query.blocks_by_kind()
+    lines: list[str] = []
     sg_styles: dict[str, str] = {}
-    for role, label in _ROLE_LABELS.items():
+    for role, label in _ROLE_LABEL_ITEMS:
         block_names = groups.get(role, [])
         if not block_names:
             continue
         sg_id = sanitize_id(role)
         sg_styles[sg_id] = role
         lines.append(f'    subgraph {sg_id} ["{label}"]')
-        for bname in block_names:
-            _render_block_node(lines, bname, spec, indent=2)
+        lines.extend(_render_block_node(bname, role, indent=2) for bname in block_names)
         lines.append("    end")
-    return sg_styles
+    return lines, sg_styles
 
 
-def _render_tag_groups(lines: list[str], spec: GDSSpec, tag_key: str) -> dict[str, str]:
+def _render_tag_groups(spec: GDSSpec, tag_key: str) -> tuple[list[str], dict[str, str]]:
     """Group blocks by a tag key into subgraphs.
 
-    Returns empty sg map (no role styling).
+    Returns the subgraph lines and an empty sg map (no role styling).
     """
-    groups: dict[str, list[str]] = defaultdict(list)
+    groups: dict[str, list[tuple[str, str]]] = {}
     for bname, block in spec.blocks.items():
         tag_val = block.get_tag(tag_key)
-        if tag_val is not None:
-            groups[tag_val].append(bname)
-        else:
-            groups["Ungrouped"].append(bname)
+        key = tag_val if tag_val is not None else "Ungrouped"
+        kind = getattr(block, "kind", "generic")
+        groups.setdefault(key, []).append((bname, kind))
 
-    for group_name, block_names in groups.items():
+    lines: list[str] = []
+    for group_name, members in groups.items():
         sg_id = sanitize_id(group_name)
         lines.append(f'    subgraph {sg_id} ["{group_name}"]')
-        for bname in block_names:
-            _render_block_node(lines, bname, spec, indent=2)
+        lines.extend(
+            _render_block_node(bname, kind, indent=2) for bname, kind in members
+        )
         lines.append("    end")
 
     # Tag groups don't have role-based subgraph styling
-    return {}
+    return lines, {}
 
 
-def _render_block_node(
-    lines: list[str], bname: str, spec: GDSSpec, indent: int = 2
-) -> None:
+def _render_block_node(bname: str, kind: str, indent: int = 2) -> str:
     """Render a single block node with role-appropriate shape and class."""
     prefix = "    " * indent
-    block = spec.blocks[bname]
-    kind = getattr(block, "kind", "generic")
     shape_open, shape_close = _ROLE_SHAPES.get(kind, _DEFAULT_SHAPE)
     bid = sanitize_id(bname)
-    lines.append(f"{prefix}{bid}{shape_open}{bname}{shape_close}:::{kind}")
+    return f"{prefix}{bid}{shape_open}{bname}{shape_close}:::{kind}"
 
 
-def _render_entities(lines: list[str], spec: GDSSpec, query: SpecQuery) -> None:
+def _render_entities(spec: GDSSpec, query: SpecQuery) -> list[str]:
     """Render entity cylinders and mechanism->entity update edges."""
     update_map = query.entity_update_map()
+    lines: list[str] = []
 
+    eids: dict[str, str] = {}
     for ename, entity in spec.entities.items():
-        var_parts: list[str] = []
-        for vname, var in entity.variables.items():
-            if var.symbol:
-                var_parts.append(f"{vname}: {var.symbol}")
-            else:
-                var_parts.append(vname)
-        var_str = ", ".join(var_parts)
-        eid = _entity_id(ename)
-        lines.append(f'    {eid}[("{ename}<br/>{var_str}")]:::entity')
-
-    # Dotted edges from mechanisms to entities (deduplicated)
-    seen_edges: set[tuple[str, str]] = set()
+        var_str = ", ".join(
+            f"{vname}: {var.symbol}" if var.symbol else vname
+            for vname, var in entity.variables.items()
+        )
+        label = f"{ename}<br/>{var_str}" if var_str else ename
+        eid = eids[ename] = _entity_id(ename)
+        lines.append(f'    {eid}[("{label}")]:::entity')
+
+    # Dotted edges from mechanisms to entities (deduplicated).
+    mids = {
+        mname: sanitize_id(mname)
+        for var_map in update_map.values()
+        for mechs in var_map.values()
+        for mname in mechs
+    }
+    # entity ID -> mechanism IDs already linked to it; avoids building a
+    # (mid, eid) tuple per candidate edge.
+    seen: dict[str, set[str]] = defaultdict(set)
     for ename, var_map in update_map.items():
-        eid = _entity_id(ename)
+        eid = eids[ename]
+        seen_mids = seen[eid]
         for _vname, mechs in var_map.items():
             for mname in mechs:
-                mid = sanitize_id(mname)
-                if (mid, eid) not in seen_edges:
-                    seen_edges.add((mid, eid))
+                mid = mids[mname]
+                if mid not in seen_mids:
+                    seen_mids.add(mid)
                     lines.append(f"    {mid} -.-> {eid}")
+    return lines
 
 
-def _render_wires(lines: list[str], spec: GDSSpec, query: SpecQuery) -> None:
+def _render_wires(spec: GDSSpec, query: SpecQuery) -> list[str]:
     """Render dependency edges from spec wirings."""
-    # Build a space label lookup: (source, target) -> space name
-    wire_labels: dict[tuple[str, str], str] = {}
-    for wiring in spec.wirings.values():
-        for wire in wiring.wires:
-            if wire.space:
-                wire_labels[(wire.source, wire.target)] = wire.space
-
-    dep_graph = query.dependency_graph()
-    for source, targets in dep_graph.items():
-        sid = sanitize_id(source)
-        for target in sorted(targets):
-            tid = sanitize_id(target)
-            label = wire_labels.get((source, target), "")
-            if label:
-                lines.append(f"    {sid} --{label}--> {tid}")
-            else:
-                lines.append(f"    {sid} --> {tid}")
+    # Arrow lookup: (source, target) -> labelled arrow for wires with a space.
+    # Unlabelled edges fall back to a plain arrow, so the edge loop never
+    # branches and edges keep dependency-graph order.
+    arrows: dict[tuple[str, str], str] = {
+        (wire.source, wire.target): f"--{wire.space}-->"
+        for wiring in spec.wirings.values()
+        for wire in wiring.wires
+        if wire.space
+    }
+
+    dep_graph = _sorted_dep_graph(query.dependency_graph())
+
+    # Targets recur across many sources; sanitize each name exactly once.
+    names = set(dep_graph)
+    for targets in dep_graph.values():
+        names.update(targets)
+    ids = {name: sanitize_id(name) for name in names}
+
+    return [
+        f"    {ids[source]} {arrows.get((source, target), '-->')} {ids[target]}"
+        for source, targets in dep_graph.items()
+        for target in targets
+    ]
+
+
+def _sorted_dep_graph(dep_graph: dict[str, set[str]]) -> dict[str, list[str]]:
+    """Return the dependency graph with each target set sorted once."""
+    return {source: sorted(targets) for source, targets in dep_graph.items()}
@@ -6,6 +6,7 @@ from a CanonicalGDS projection.
 
 from __future__ import annotations
 
+from itertools import pairwise
 from typing import TYPE_CHECKING
 
 from gds_viz._helpers import sanitize_id
@@ -49,12 +50,18 @@ def canonical_to_mermaid(
 
     # State variable listing for X_t / X_{t+1}
     # Use entity.var format to disambiguate variables with the same name
-    var_names = [v for _, v in canonical.state_variables]
-    has_dupes = len(var_names) != len(set(var_names))
-    if has_dupes:
-        var_list = ", ".join(f"{e}.{v}" for e, v in canonical.state_variables)
-    else:
-        var_list = ", ".join(var_names)
+    var_names: list[str] = []
+    qualified: list[str] = []
+    seen: set[str] = set()
+    has_dupes = False
+    for e, v in canonical.state_variables:
+        var_names.append(v)
+        qualified.append(f"{e}.{v}")
+        if v in seen:
+            has_dupes = True
+        else:
+            seen.add(v)
+    var_list = ", ".join(qualified if has_dupes else var_names)
     if var_list:
         x_label = f"X_t<br/>{var_list}"
         x_next_label = f"X_{{t+1}}<br/>{var_list}"
@@ -65,8 +72,14 @@ def canonical_to_mermaid(
     lines.append(f'    X_t(["{x_label}"]):::state')
     lines.append(f'    X_next(["{x_next_label}"]):::state')
 
+    # Role layers, read once and reused by subgraphs and edges below
+    policy_blocks = canonical.policy_blocks
+    mechanism_blocks = canonical.mechanism_blocks
+    control_blocks = canonical.control_blocks
+    show_theta = show_parameters and canonical.has_parameters
+
     # Parameter node (Theta)
-    if show_parameters and canonical.has_parameters:
+    if show_theta:
         param_names = ", ".join(canonical.parameter_schema.names())
         lines.append(f'    Theta{{{{"\u0398<br/>{param_names}"}}}}:::param')
 
@@ -74,34 +87,32 @@ def canonical_to_mermaid(
     rendered_sgs: dict[str, str] = {}
     for sg_id, label, blocks, role in [
         ("U", "Boundary (U)", canonical.boundary_blocks, "boundary"),
-        ("g", "Policy (g)", canonical.policy_blocks, "policy"),
-        ("f", "Mechanism (f)", canonical.mechanism_blocks, "mechanism"),
-        ("ctrl", "Control", canonical.control_blocks, "control"),
+        ("g", "Policy (g)", policy_blocks, "policy"),
+        ("f", "Mechanism (f)", mechanism_blocks, "mechanism"),
+        ("ctrl", "Control", control_blocks, "control"),
     ]:
         if blocks:
-            _render_subgraph(lines, sg_id, label, blocks, role)
+            lines.extend(_render_subgraph(sg_id, label, blocks, role))
             rendered_sgs[sg_id] = role
 
     # Edges between layers
-    _render_flow_edges(lines, canonical)
+    lines.extend(_render_flow_edges(canonical))
 
     # Update edges: mechanism -> X_{t+1}
-    _render_update_edges(lines, canonical, show_updates)
+    lines.extend(_render_update_edges(canonical, show_updates))
 
-    # Control feedback edges
-    if canonical.control_blocks:
-        for cname in canonical.control_blocks:
-            cid = sanitize_id(cname)
-            # f -> ctrl (dashed)
-            lines.append(f"    f -.-> {cid}")
-            # ctrl -> g (dashed)
-            lines.append(f"    {cid} -.-> g")
+    # Control feedback edges: f -> ctrl -> g (dashed)
+    lines.extend(
+        edge
+        for cid in map(sanitize_id, control_blocks)
+        for edge in (f"    f -.-> {cid}", f"    {cid} -.-> g")
+    )
 
     # Parameter edges
-    if show_parameters and canonical.has_parameters:
-        if canonical.policy_blocks:
+    if show_theta:
+        if policy_blocks:
             lines.append("    Theta -.-> g")
-        if canonical.mechanism_blocks:
+        if mechanism_blocks:
             lines.append("    Theta -.-> f")
 
     # Subgraph background styling
@@ -111,66 +122,65 @@ def canonical_to_mermaid(
 
 
 def _render_subgraph(
-    lines: list[str],
     sg_id: str,
     label: str,
     block_names: tuple[str, ...],
     role: str = "generic",
-) -> None:
+) -> list[str]:
     """Render a subgraph for a role layer if it has blocks."""
     if not block_names:
-        return
-    lines.append(f'    subgraph {sg_id} ["{label}"]')
-    for name in block_names:
-        sid = sanitize_id(name)
-        lines.append(f"        {sid}[{name}]:::{role}")
-    lines.append("    end")
+        return []
+    return [
+        f'    subgraph {sg_id} ["{label}"]',
+        *(f"        {sanitize_id(name)}[{name}]:::{role}" for name in block_names),
+        "    end",
+    ]
 
 
-def _render_flow_edges(lines: list[str], canonical: CanonicalGDS) -> None:
+def _render_flow_edges(canonical: CanonicalGDS) -> list[str]:
     """Render forward-flow edges between role layers.
 
     Uses subgraph-level edges between layers to avoid spurious
     cross-product connections (e.g. Alice Decision -> Bob World Model).
     Individual block edges are only used for X_t -> first layer.
     """
-    layer_ids: list[str] = []
-    if canonical.boundary_blocks:
-        layer_ids.append("U")
-    if canonical.policy_blocks:
-        layer_ids.append("g")
-    if canonical.mechanism_blocks:
-        layer_ids.append("f")
+    layer_ids = [
+        layer_id
+        for layer_id, blocks in (
+            ("U", canonical.boundary_blocks),
+            ("g", canonical.policy_blocks),
+            ("f", canonical.mechanism_blocks),
+        )
+        if blocks
+    ]
 
     if not layer_ids:
-        lines.append("    X_t --> X_next")
-        return
+        return ["    X_t --> X_next"]
 
     # X_t -> first subgraph
-    lines.append(f"    X_t --> {layer_ids[0]}")
+    lines = [f"    X_t --> {layer_ids[0]}"]
 
     # Inter-layer: subgraph -> subgraph
-    for i in range(len(layer_ids) - 1):
-        lines.append(f"    {layer_ids[i]} --> {layer_ids[i + 1]}")
+    lines.extend(f"    {a} --> {b}" for a, b in pairwise(layer_ids))
 
     # Last layer -> X_{t+1} (only if update edges won't cover this)
     if layer_ids[-1] != "f":
         lines.append(f"    {layer_ids[-1]} --> X_next")
+    return lines
 
 
-def _render_update_edges(
-    lines: list[str], canonical: CanonicalGDS, show_updates: bool
-) -> None:
+def _render_update_edges(canonical: CanonicalGDS, show_updates: bool) -> list[str]:
     """Render edges from mechanisms to X_{t+1}."""
     if not canonical.mechanism_blocks:
-        return
+        return []
 
     if show_updates and canonical.update_map:
-        for mech_name, updates in canonical.update_map:
-            mid = sanitize_id(mech_name)
-            for entity, var in updates:
-                lines.append(f"    {mid} -.-> |{entity}.{var}| X_next")
-    else:
-        for mech_name in canonical.mechanism_blocks:
-            mid = sanitize_id(mech_name)
-            lines.append(f"    {mid} --> X_next")
+        return [
+            f"    {sanitize_id(mech_name)} -.-> |{entity}.{var}| X_next"
+            for mech_name, updates in canonical.update_map
+            for entity, var in updates
+        ]
+    return [
+        f"    {sanitize_id(mech_name)} --> X_next"
+        for mech_name in canonical.mechanism_blocks
+    ]
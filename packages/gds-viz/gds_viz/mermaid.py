@@ -21,17 +21,25 @@ The module provides two visualization strategies:
 
 from __future__ import annotations
 
+import functools
+import io
 from typing import TYPE_CHECKING
 
 from gds.ir.models import CompositionType, FlowDirection, HierarchyNodeIR
 from gds_viz._helpers import sanitize_id
-from gds_viz._styles import MermaidTheme, classdefs_for_roles, theme_directive
+from gds_viz._styles import MermaidTheme, flowchart_prelude
 
 if TYPE_CHECKING:
     from gds.blocks.base import Block
     from gds.ir.models import SystemIR
 
 
+# (shape_open, shape_close, role) for flat block nodes.
+_BOUNDARY_STYLE: tuple[str, str, str] = ("([", "])", "boundary")
+_MECHANISM_STYLE: tuple[str, str, str] = ("[[", "]]", "mechanism")
+_GENERIC_STYLE: tuple[str, str, str] = ("[", "]", "generic")
+
+
 def system_to_mermaid(
     system: SystemIR,
     show_hierarchy: bool = False,
@@ -60,52 +68,59 @@ def system_to_mermaid(
         print(mermaid)
         ```
     """
-    lines = [theme_directive(theme), "flowchart TD"]
+    # Every line is written newline-terminated; the final newline is dropped
+    # on return.
+    buf = io.StringIO()
+    write = buf.write
+    # Theme directive and class definitions for role-based styling
+    write(flowchart_prelude("TD", theme, roles_only=True))
 
-    # Class definitions for role-based styling
-    lines.extend(classdefs_for_roles(theme))
+    # Wiring endpoints recur across many edges; sanitize each name exactly once.
+    endpoints = {w.source for w in system.wirings} | {w.target for w in system.wirings}
+    ids = {name: sanitize_id(name) for name in endpoints}
 
     if show_hierarchy and system.hierarchy:
-        lines.append(_hierarchy_to_mermaid(system.hierarchy, indent=1))
+        _hierarchy_to_mermaid(buf, system.hierarchy, indent=1)
     else:
         # Flat block diagram with role-based classes
-        block_shapes = _get_block_shapes(system)
-        block_roles = _get_block_roles(system)
         for block in system.blocks:
-            shape_open, shape_close = block_shapes.get(block.name, ("[", "]"))
-            safe_name = sanitize_id(block.name)
-            role = block_roles.get(block.name, "generic")
-            lines.append(
-                f"    {safe_name}{shape_open}{block.name}{shape_close}:::{role}"
-            )
+            write(_block_node(block.name, block.signature))
 
-    # Add wirings
+    # Add wirings; identical edges (same endpoints, kind and label) are drawn once
+    emitted: set[str] = set()
     for wiring in system.wirings:
-        src = sanitize_id(wiring.source)
-        tgt = sanitize_id(wiring.target)
+        src = ids[wiring.source]
+        tgt = ids[wiring.target]
         label = wiring.label
 
         if wiring.is_temporal:
             # Temporal loop: dashed line with arrow back
-            lines.append(f"    {src} -.{label}..-> {tgt}")
+            edge = f"    {src} -.{label}..-> {tgt}\n"
         elif wiring.is_feedback:
             # Feedback: thick arrow
-            lines.append(f"    {src} =={label}==> {tgt}")
+            edge = f"    {src} =={label}==> {tgt}\n"
         elif wiring.direction == FlowDirection.CONTRAVARIANT:
             # Contravariant: backward arrow
-            lines.append(f"    {tgt} <--{label}--- {src}")
+            edge = f"    {tgt} <--{label}--- {src}\n"
         else:
             # Covariant forward: normal arrow
-            lines.append(f"    {src} --{label}--> {tgt}")
+            edge = f"    {src} --{label}--> {tgt}\n"
 
-    return "\n".join(lines)
+        if edge not in emitted:
+            emitted.add(edge)
+            write(edge)
+
+    return buf.getvalue()[:-1]
 
 
 def block_to_mermaid(block: Block, *, theme: MermaidTheme | None = None) -> str:
     """Generate a Mermaid flowchart from a Block composition tree.
 
     This is a convenience wrapper that flattens the block and creates
-    a minimal diagram showing the composition structure.
+    a minimal diagram showing the composition structure. It compiles the
+    block on every call; to render the same composition several times
+    (e.g. in multiple themes), compile once with ``compile_system`` and
+    pass the result to ``system_to_mermaid``.
 
     Args:
         block: The root block (atomic or composite).
@@ -149,72 +164,47 @@ def block_to_mermaid(block: Block, *, theme: MermaidTheme | None = None) -> str:
     return system_to_mermaid(system, show_hierarchy=False, theme=theme)
 
 
-def _hierarchy_to_mermaid(node: HierarchyNodeIR, indent: int = 1) -> str:
-    """Recursively render hierarchy nodes as subgraphs."""
+def _hierarchy_to_mermaid(
+    buf: io.StringIO, node: HierarchyNodeIR, indent: int = 1
+) -> None:
+    """Recursively write hierarchy nodes into ``buf`` as subgraphs."""
     prefix = "    " * indent
-    lines = []
 
     if node.composition_type is None:
         # Leaf node - render as block
         safe_name = sanitize_id(node.name)
-        lines.append(f"{prefix}{safe_name}[{node.name}]")
+        buf.write(f"{prefix}{safe_name}[{node.name}]\n")
     else:
         # Composite node - render as subgraph
         subgraph_id = sanitize_id(node.id)
         comp_label = _composition_label(node.composition_type)
-        lines.append(f"{prefix}subgraph {subgraph_id} [{comp_label}]")
+        buf.write(f"{prefix}subgraph {subgraph_id} [{comp_label}]\n")
         for child in node.children:
-            lines.append(_hierarchy_to_mermaid(child, indent + 1))
-        lines.append(f"{prefix}end")
-
-    return "\n".join(lines)
+            _hierarchy_to_mermaid(buf, child, indent + 1)
+        buf.write(f"{prefix}end\n")
 
 
-def _get_block_shapes(system: SystemIR) -> dict[str, tuple[str, str]]:
-    """Determine Mermaid shapes for blocks based on their signature.
+@functools.lru_cache(maxsize=4096)
+def _block_node(name: str, signature: tuple[str, str, str, str]) -> str:
+    """Render a flat block node line, reused across renders of the same block."""
+    shape_open, shape_close, role = _block_style(signature)
+    return f"    {sanitize_id(name)}{shape_open}{name}{shape_close}:::{role}\n"
 
-    Returns dict mapping block name to (shape_open, shape_close) pair.
-    - BoundaryAction (no inputs): stadium ([( ... )])
-    - Terminal Mechanism (no outputs): double bracket ([[ ... ]])
-    - Normal blocks: rectangle ([ ... ])
-    """
-    shapes = {}
-    for block in system.blocks:
-        fwd_in, fwd_out, bwd_in, bwd_out = block.signature
-        has_input = bool(fwd_in) or bool(bwd_in)
-        has_output = bool(fwd_out) or bool(bwd_out)
-
-        if not has_input:
-            # Boundary action
-            shapes[block.name] = ("([", "])")
-        elif not has_output:
-            # Terminal mechanism
-            shapes[block.name] = ("[[", "]]")
-        else:
-            # Normal block
-            shapes[block.name] = ("[", "]")
-
-    return shapes
 
+def _block_style(signature: tuple[str, str, str, str]) -> tuple[str, str, str]:
+    """Determine Mermaid shape and GDS role for a block from its signature.
 
-def _get_block_roles(system: SystemIR) -> dict[str, str]:
-    """Determine GDS role for blocks based on their signature.
-
-    Maps block names to role keys: boundary, mechanism, or generic.
+    Returns (shape_open, shape_close, role).
+    - BoundaryAction (no inputs): stadium ([( ... )]), role boundary
+    - Terminal Mechanism (no outputs): double bracket ([[ ... ]]), role mechanism
+    - Normal blocks: rectangle ([ ... ]), role generic
     """
-    roles: dict[str, str] = {}
-    for block in system.blocks:
-        fwd_in, fwd_out, bwd_in, bwd_out = block.signature
-        has_input = bool(fwd_in) or bool(bwd_in)
-        has_output = bool(fwd_out) or bool(bwd_out)
-
-        if not has_input:
-            roles[block.name] = "boundary"
-        elif not has_output:
-            roles[block.name] = "mechanism"
-        else:
-            roles[block.name] = "generic"
-    return roles
+    fwd_in, fwd_out, bwd_in, bwd_out = signature
+    if not (fwd_in or bwd_in):
+        return _BOUNDARY_STYLE
+    if not (fwd_out or bwd_out):
+        return _MECHANISM_STYLE
+    return _GENERIC_STYLE
 
 
 def _composition_label(comp_type: CompositionType) -> str:
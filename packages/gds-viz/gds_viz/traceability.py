@@ -11,13 +11,16 @@ can affect it, and which parameters feed those blocks.
 
 from __future__ import annotations
 
+import functools
+import io
+from collections import deque
 from typing import TYPE_CHECKING
 
 from gds.query import SpecQuery
 from gds_viz._helpers import entity_id as _entity_id
 from gds_viz._helpers import param_id as _param_id
 from gds_viz._helpers import sanitize_id
-from gds_viz._styles import MermaidTheme, classdefs_for_all, theme_directive
+from gds_viz._styles import MermaidTheme, flowchart_prelude
 
 if TYPE_CHECKING:
     from gds.spec import GDSSpec
@@ -38,100 +41,93 @@ def params_to_mermaid(spec: GDSSpec, *, theme: MermaidTheme | None = None) -> st
     Returns:
         Mermaid flowchart diagram as a string.
     """
-    lines = [theme_directive(theme), "flowchart LR"]
+    buf = io.StringIO()
+    write = buf.write
+    # Theme directive and class definitions
+    write(flowchart_prelude("LR", theme))
     query = SpecQuery(spec)
 
-    # Class definitions
-    lines.extend(classdefs_for_all(theme))
-
     param_to_blocks = query.param_to_blocks()
-    entity_update_map = query.entity_update_map()
 
     # Collect which params and blocks are actually connected
-    active_params = {p for p, blocks in param_to_blocks.items() if blocks}
+    active_params = sorted(p for p, blocks in param_to_blocks.items() if blocks)
     if not active_params:
-        lines.append("    no_params[No parameters defined]:::empty")
-        return "\n".join(lines)
+        write("    no_params[No parameters defined]:::empty\n")
+        return buf.getvalue()[:-1]
 
     # Parameter nodes (hexagons)
-    for pname in sorted(active_params):
-        pid = _param_id(pname)
-        lines.append(f'    {pid}{{{{"{pname}"}}}}:::param')
-
-    # Block nodes — only those referenced by parameters
+    pids = {pname: _param_id(pname) for pname in active_params}
+    for pname, pid in pids.items():
+        write(f'    {pid}{{{{"{pname}"}}}}:::param\n')
+
+    # Blocks referenced by parameters, plus everything reachable from them
+    # via the dependency chain. Entity nodes are those updated by any of
+    # these blocks; the walk starts at the param blocks, so it covers their
+    # own updates too.
     param_blocks: set[str] = set()
     for blocks in param_to_blocks.values():
         param_blocks.update(blocks)
 
-    for bname in sorted(param_blocks):
-        bid = sanitize_id(bname)
-        lines.append(f"    {bid}[{bname}]")
-
-    # Entity nodes — only those updated by param-connected blocks
-    # Build reverse map: mechanism -> [(entity, var)]
-    mech_to_updates: dict[str, list[tuple[str, str]]] = {}
-    for ename, var_map in entity_update_map.items():
-        for vname, mechs in var_map.items():
-            for mname in mechs:
-                mech_to_updates.setdefault(mname, []).append((ename, vname))
-
+    mech_to_updates = query.mechanism_update_map()
     active_entities: set[str] = set()
-    for bname in param_blocks:
-        if bname in mech_to_updates:
-            for ename, _ in mech_to_updates[bname]:
-                active_entities.add(ename)
-
-    # Also include entities reachable via dependency chain from param blocks
     dep_graph = query.dependency_graph()
     visited: set[str] = set()
-    frontier = list(param_blocks)
+    frontier = deque(param_blocks)
     while frontier:
-        current = frontier.pop()
+        current = frontier.popleft()
         if current in visited:
             continue
         visited.add(current)
         if current in mech_to_updates:
             for ename, _ in mech_to_updates[current]:
                 active_entities.add(ename)
-        for target in dep_graph.get(current, set()):
-            frontier.append(target)
+        frontier.extend(t for t in dep_graph.get(current, ()) if t not in visited)
+
+    # Every block name referenced below is in `visited`; sanitize each once.
+    reachable = sorted(visited)
+    ids = {bname: sanitize_id(bname) for bname in reachable}
+
+    # Block nodes — only those referenced by parameters
+    for bname in sorted(param_blocks):
+        write(f"    {ids[bname]}[{bname}]\n")
 
     for ename in sorted(active_entities):
-        entity = spec.entities[ename]
-        var_parts = []
-        for vname, var in entity.variables.items():
-            var_parts.append(var.symbol if var.symbol else vname)
-        var_str = ", ".join(var_parts)
-        eid = _entity_id(ename)
-        lines.append(f'    {eid}[("{ename}<br/>{var_str}")]:::entity')
+        variables = spec.entities[ename].variables
+        var_labels = tuple(var.symbol or vname for vname, var in variables.items())
+        write(_entity_node(ename, var_labels))
 
     # Edges: param -> block
-    for pname in sorted(active_params):
-        pid = _param_id(pname)
+    for pname, pid in pids.items():
         for bname in param_to_blocks[pname]:
-            bid = sanitize_id(bname)
-            lines.append(f"    {pid} -.-> {bid}")
+            write(f"    {pid} -.-> {ids[bname]}\n")
 
     # Edges: block -> entity (for blocks in the param-reachable set)
     seen_edges: set[tuple[str, str]] = set()
-    for bname in visited:
+    for bname in reachable:
         if bname in mech_to_updates:
-            bid = sanitize_id(bname)
+            bid = ids[bname]
             for ename, _vname in mech_to_updates[bname]:
                 eid = _entity_id(ename)
                 if (bid, eid) not in seen_edges:
                     seen_edges.add((bid, eid))
-                    lines.append(f"    {bid} -.-> {eid}")
+                    write(f"    {bid} -.-> {eid}\n")
 
-    # Edges: block -> block (dependency flow within param-reachable set)
-    for source in sorted(visited):
-        for target in sorted(dep_graph.get(source, set())):
-            if target in visited:
-                sid = sanitize_id(source)
-                tid = sanitize_id(target)
-                lines.append(f"    {sid} --> {tid}")
+    # Edges: block -> block (dependency flow within param-reachable set).
+    # The walk above closed `visited` under dep_graph, so every target of a
+    # reachable source is itself reachable.
+    for source in reachable:
+        sid = ids[source]
+        for target in sorted(dep_graph.get(source, ())):
+            write(f"    {sid} --> {ids[target]}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()[:-1]
+
+
+@functools.lru_cache(maxsize=1024)
+def _entity_node(ename: str, var_labels: tuple[str, ...]) -> str:
+    """Render an entity cylinder line, reused across renders of the same spec."""
+    var_str = ", ".join(var_labels)
+    return f'    {_entity_id(ename)}[("{ename}<br/>{var_str}")]:::entity\n'
 
 
 def trace_to_mermaid(
@@ -156,28 +152,29 @@ def trace_to_mermaid(
     Returns:
         Mermaid flowchart diagram as a string.
     """
-    lines = [theme_directive(theme), "flowchart RL"]
+    buf = io.StringIO()
+    write = buf.write
+    # Theme directive and class definitions
+    write(flowchart_prelude("RL", theme))
     query = SpecQuery(spec)
 
-    # Class definitions
-    lines.extend(classdefs_for_all(theme))
-
     affecting = query.blocks_affecting(entity, variable)
     if not affecting:
-        lines.append(f"    target[{entity}.{variable}]:::target")
-        lines.append("    none[No affecting blocks]:::empty")
-        return "\n".join(lines)
+        write(f"    target[{entity}.{variable}]:::target\n")
+        write("    none[No affecting blocks]:::empty\n")
+        return buf.getvalue()[:-1]
 
     # Target node
     ent = spec.entities[entity]
     var = ent.variables[variable]
     symbol = var.symbol if var.symbol else variable
-    lines.append(f'    target(["{entity}.{variable} ({symbol})"]):::target')
+    write(f'    target(["{entity}.{variable} ({symbol})"]):::target\n')
 
-    # Block nodes
-    for bname in affecting:
-        bid = sanitize_id(bname)
-        lines.append(f"    {bid}[{bname}]")
+    # Block nodes; block -> block and param -> block edges stay inside
+    # `affecting`, so those names are sanitized once here.
+    ids = {bname: sanitize_id(bname) for bname in affecting}
+    for bname, bid in ids.items():
+        write(f"    {bid}[{bname}]\n")
 
     # Parameter nodes for affecting blocks
     block_to_params = query.block_to_params()
@@ -188,29 +185,25 @@ def trace_to_mermaid(
 
     for pname in sorted(active_params):
         pid = _param_id(pname)
-        lines.append(f'    {pid}{{{{"{pname}"}}}}:::param')
+        write(f'    {pid}{{{{"{pname}"}}}}:::param\n')
 
     # Edges: mechanism -> target
     entity_update_map = query.entity_update_map()
     direct_mechs = entity_update_map.get(entity, {}).get(variable, [])
     for mname in direct_mechs:
-        mid = sanitize_id(mname)
-        lines.append(f"    {mid} ==> target")
+        write(f"    {sanitize_id(mname)} ==> target\n")
 
     # Edges: block -> block (dependency within affecting set)
     dep_graph = query.dependency_graph()
-    for source in affecting:
-        sid = sanitize_id(source)
-        for target in dep_graph.get(source, set()):
-            if target in affecting:
-                tid = sanitize_id(target)
-                lines.append(f"    {sid} --> {tid}")
+    for source, sid in ids.items():
+        for target in dep_graph.get(source, ()):
+            if target in ids:
+                write(f"    {sid} --> {ids[target]}\n")
 
     # Edges: param -> block
-    for bname in affecting:
-        bid = sanitize_id(bname)
+    for bname, bid in ids.items():
         for pname in block_to_params.get(bname, []):
             pid = _param_id(pname)
-            lines.append(f"    {pid} -.-> {bid}")
+            write(f"    {pid} -.-> {bid}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()[:-1]
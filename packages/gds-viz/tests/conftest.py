@@ -1,8 +1,41 @@
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from gds.ir.models import SystemIR
+    from gds.spec import GDSSpec
 
 EXAMPLES_ROOT = Path(__file__).resolve().parents[2] / "gds-examples"
 if EXAMPLES_ROOT.is_dir():
     sys.path.insert(0, str(EXAMPLES_ROOT))
+
+
+@functools.cache
+def _build(example: str, builder: str) -> GDSSpec | SystemIR:
+    module = pytest.importorskip(example)
+    return getattr(module.model, builder)()
+
+
+class ExampleModels:
+    """Session-wide memo over the gds-examples ``build_spec``/``build_system``.
+
+    Skips the requesting test when the example is not importable. Results
+    are shared between tests and must be treated as read-only.
+    """
+
+    def spec(self, example: str) -> GDSSpec:
+        return _build(example, "build_spec")
+
+    def system(self, example: str) -> SystemIR:
+        return _build(example, "build_system")
+
+
+@pytest.fixture(scope="session")
+def example_models() -> ExampleModels:
+    return ExampleModels()
@@ -123,6 +123,13 @@ class TestArchitectureEntities:
         # StateVariable has symbol="N"
         assert "count: N" in out
 
+    def test_entity_without_variables_has_bare_label(self):
+        spec = _minimal_spec()
+        spec.register_entity(Entity(name="Empty", variables={}))
+        out = spec_to_mermaid(spec)
+        assert 'entity_Empty[("Empty")]:::entity' in out
+        assert "Empty<br/>" not in out
+
     def test_mechanism_to_entity_dotted_edges(self):
         spec = _minimal_spec()
         out = spec_to_mermaid(spec)
@@ -176,9 +183,8 @@ class TestArchitectureWires:
 
 
 class TestArchitectureIntegration:
-    def test_sir_epidemic(self):
-        sir = __import__("pytest").importorskip("sir_epidemic")
-        spec = sir.model.build_spec()
+    def test_sir_epidemic(self, example_models):
+        spec = example_models.spec("sir_epidemic")
         out = spec_to_mermaid(spec)
 
         assert "flowchart TD" in out
@@ -191,9 +197,8 @@ class TestArchitectureIntegration:
         assert "Infected" in out
         assert "Recovered" in out
 
-    def test_prisoners_dilemma(self):
-        pd = __import__("pytest").importorskip("prisoners_dilemma")
-        spec = pd.model.build_spec()
+    def test_prisoners_dilemma(self, example_models):
+        spec = example_models.spec("prisoners_dilemma")
         out = spec_to_mermaid(spec)
 
         assert "flowchart TD" in out
@@ -155,11 +155,10 @@ class TestCanonicalEdges:
 
 
 class TestCanonicalIntegration:
-    def test_sir_epidemic(self):
-        sir = __import__("pytest").importorskip("sir_epidemic")
+    def test_sir_epidemic(self, example_models):
         from gds.canonical import project_canonical
 
-        spec = sir.model.build_spec()
+        spec = example_models.spec("sir_epidemic")
         canon = project_canonical(spec)
         out = canonical_to_mermaid(canon)
 
@@ -178,11 +177,10 @@ class TestCanonicalIntegration:
         # Update edges
         assert "X_next" in out
 
-    def test_thermostat_has_control(self):
-        thermo = __import__("pytest").importorskip("thermostat")
+    def test_thermostat_has_control(self, example_models):
         from gds.canonical import project_canonical
 
-        spec = thermo.model.build_spec()
+        spec = example_models.spec("thermostat")
         canon = project_canonical(spec)
         out = canonical_to_mermaid(canon)
 
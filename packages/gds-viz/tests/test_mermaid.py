@@ -69,6 +69,21 @@ class TestSystemToMermaid:
         mermaid = system_to_mermaid(system)
         assert "A --signal--> B" in mermaid
 
+    def test_duplicate_wirings_rendered_once(self):
+        wiring = WiringIR(
+            source="A",
+            target="B",
+            label="signal",
+            direction=FlowDirection.COVARIANT,
+        )
+        system = SystemIR(
+            name="Test",
+            blocks=[BlockIR(name="A"), BlockIR(name="B")],
+            wirings=[wiring, wiring.model_copy()],
+        )
+        mermaid = system_to_mermaid(system)
+        assert mermaid.count("A --signal--> B") == 1
+
     def test_renders_contravariant_wiring_as_backward_arrow(self):
         system = SystemIR(
             name="Test",
@@ -204,9 +219,8 @@ class TestBlockToMermaid:
 
 
 class TestFullExample:
-    def test_sir_epidemic_diagram(self):
-        sir = __import__("pytest").importorskip("sir_epidemic")
-        system = sir.model.build_system()
+    def test_sir_epidemic_diagram(self, example_models):
+        system = example_models.system("sir_epidemic")
         mermaid = system_to_mermaid(system)
 
         # Check key elements
@@ -220,9 +234,8 @@ class TestFullExample:
         # Check wirings
         assert "-->" in mermaid  # covariant arrows
 
-    def test_thermostat_with_feedback(self):
-        thermo = __import__("pytest").importorskip("thermostat")
-        system = thermo.model.build_system()
+    def test_thermostat_with_feedback(self, example_models):
+        system = example_models.system("thermostat")
         mermaid = system_to_mermaid(system)
 
         # Check feedback wiring
@@ -230,9 +243,8 @@ class TestFullExample:
         assert len(feedback_wirings) == 1
         assert "==" in mermaid  # thick arrow for feedback
 
-    def test_lotka_volterra_with_temporal_loop(self):
-        lv = __import__("pytest").importorskip("lotka_volterra")
-        system = lv.model.build_system()
+    def test_lotka_volterra_with_temporal_loop(self, example_models):
+        system = example_models.system("lotka_volterra")
         mermaid = system_to_mermaid(system)
 
         # Check temporal wiring
@@ -240,9 +252,8 @@ class TestFullExample:
         assert len(temporal_wirings) == 2
         assert "-." in mermaid  # dashed arrow for temporal
 
-    def test_prisoners_dilemma_complex(self):
-        pd = __import__("pytest").importorskip("prisoners_dilemma")
-        system = pd.model.build_system()
+    def test_prisoners_dilemma_complex(self, example_models):
+        system = example_models.system("prisoners_dilemma")
         mermaid = system_to_mermaid(system)
 
         # Should have 6 blocks
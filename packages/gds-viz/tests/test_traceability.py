@@ -101,9 +101,8 @@ class TestParamInfluence:
         out = params_to_mermaid(spec)
         assert "No parameters defined" in out
 
-    def test_sir_integration(self):
-        sir = __import__("pytest").importorskip("sir_epidemic")
-        spec = sir.model.build_spec()
+    def test_sir_integration(self, example_models):
+        spec = example_models.spec("sir_epidemic")
         out = params_to_mermaid(spec)
         assert "param_beta" in out
         assert "param_gamma" in out
@@ -112,9 +111,8 @@ class TestParamInfluence:
         assert "entity_Infected" in out
         assert "entity_Recovered" in out
 
-    def test_pd_no_params(self):
-        pd = __import__("pytest").importorskip("prisoners_dilemma")
-        spec = pd.model.build_spec()
+    def test_pd_no_params(self, example_models):
+        spec = example_models.spec("prisoners_dilemma")
         out = params_to_mermaid(spec)
         assert "No parameters defined" in out
 
@@ -160,18 +158,16 @@ class TestTraceability:
         out = trace_to_mermaid(spec, "Pop", "count")
         assert "flowchart RL" in out
 
-    def test_sir_trace_integration(self):
-        sir = __import__("pytest").importorskip("sir_epidemic")
-        spec = sir.model.build_spec()
+    def test_sir_trace_integration(self, example_models):
+        spec = example_models.spec("sir_epidemic")
         out = trace_to_mermaid(spec, "Susceptible", "count")
         assert "Update_Susceptible ==> target" in out
         assert "Contact_Process" in out
         assert "Infection_Policy" in out
         assert "param_beta" in out
 
-    def test_thermostat_trace_integration(self):
-        thermo = __import__("pytest").importorskip("thermostat")
-        spec = thermo.model.build_spec()
+    def test_thermostat_trace_integration(self, example_models):
+        spec = example_models.spec("thermostat")
         out = trace_to_mermaid(spec, "Room", "temperature")
         assert "Update_Room ==> target" in out
         assert "PID_Controller" in out